@@ -0,0 +1,194 @@
+import logging
+import threading
+import time
+from collections import defaultdict, deque
+from contextlib import contextmanager
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connection
+from rest_framework.mixins import ListModelMixin, RetrieveModelMixin
+from rest_framework.response import Response
+
+logger = logging.getLogger(__name__)
+
+PERCENTILES = (50, 95, 99)
+METRICS = ('queries', 'sql_ms', 'serialize_ms', 'render_ms', 'total_ms',
+           'size')
+
+
+class QueryBudgetExceeded(Exception):
+    pass
+
+
+def get_config():
+    return getattr(settings, 'REQUEST_METRICS', {})
+
+
+def percentile(ordered, percent):
+    index = max(0, -(-len(ordered) * percent // 100) - 1)
+    return ordered[index]
+
+
+class MetricsRegistry:
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._samples = {}
+
+    def record(self, route, sample):
+        window = get_config().get('WINDOW', 1000)
+        with self._lock:
+            route_samples = self._samples.setdefault(
+                route, defaultdict(lambda: deque(maxlen=window)))
+            for name in METRICS:
+                route_samples[name].append(sample[name])
+
+    def summary(self):
+        with self._lock:
+            snapshot = {
+                route: {name: sorted(values)
+                        for name, values in samples.items()}
+                for route, samples in self._samples.items()
+            }
+        return {
+            route: {
+                'requests': len(samples['total_ms']),
+                **{
+                    name: {
+                        f'p{percent}': percentile(values, percent)
+                        for percent in PERCENTILES
+                    }
+                    for name, values in samples.items()
+                },
+            }
+            for route, samples in snapshot.items()
+        }
+
+    def reset(self):
+        with self._lock:
+            self._samples.clear()
+
+
+registry = MetricsRegistry()
+
+
+class QueryCounter:
+
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.duration += time.perf_counter() - start
+            self.count += 1
+
+
+def to_ms(seconds):
+    return round(seconds * 1000, 3)
+
+
+class RequestMetricsMiddleware:
+
+    def __init__(self, get_response):
+        if not get_config().get('ENABLED'):
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+
+    def __call__(self, request):
+        counter = QueryCounter()
+        request._metrics = {'counter': counter}
+        start = time.perf_counter()
+        with connection.execute_wrapper(counter):
+            response = self.get_response(request)
+        total = time.perf_counter() - start
+
+        match = request.resolver_match
+        if match is None or not match.url_name:
+            return response
+        marks = request._metrics
+        view_end = marks.get('view_end', start + total)
+        sample = {
+            'queries': counter.count,
+            'sql_ms': to_ms(counter.duration),
+            'serialize_ms': to_ms(max(marks.get('serialize', 0), 0)),
+            'render_ms': to_ms(start + total - view_end),
+            'total_ms': to_ms(total),
+            'size': (len(response.content)
+                     if not response.streaming else 0),
+        }
+        registry.record(match.url_name, sample)
+        response['Server-Timing'] = ', '.join((
+            f'db;dur={sample["sql_ms"]};desc="{sample["queries"]} queries"',
+            f'serialize;dur={sample["serialize_ms"]}',
+            f'render;dur={sample["render_ms"]}',
+            f'total;dur={sample["total_ms"]}',
+        ))
+        self.check_budget(match.url_name, sample)
+        return response
+
+    def process_template_response(self, request, response):
+        request._metrics['view_end'] = time.perf_counter()
+        return response
+
+    def check_budget(self, route, sample):
+        budget = get_config().get('BUDGETS', {}).get(route)
+        if not budget:
+            return
+        exceeded = {
+            name: sample[name] for name, limit in budget.items()
+            if sample[name] > limit
+        }
+        if not exceeded:
+            return
+        message = f'Превышен бюджет для {route}: {exceeded}, лимит {budget}'
+        if get_config().get('STRICT'):
+            raise QueryBudgetExceeded(message)
+        logger.warning(message)
+
+
+@contextmanager
+def measure_serialize(request):
+    marks = getattr(request, '_metrics', None)
+    if marks is None:
+        yield
+        return
+    counter = marks['counter']
+    start = time.perf_counter()
+    sql_before = counter.duration
+    try:
+        yield
+    finally:
+        # Запросы, выполненные сериализатором, уже учтены в sql_ms.
+        elapsed = time.perf_counter() - start
+        marks['serialize'] = (marks.get('serialize', 0) + elapsed
+                              - (counter.duration - sql_before))
+
+
+class ListMetricsMixin(ListModelMixin):
+
+    def list(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset())
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            serializer = self.get_serializer(page, many=True)
+            with measure_serialize(request):
+                data = serializer.data
+            return self.get_paginated_response(data)
+        serializer = self.get_serializer(queryset, many=True)
+        with measure_serialize(request):
+            data = serializer.data
+        return Response(data)
+
+
+class RetrieveMetricsMixin(RetrieveModelMixin):
+
+    def retrieve(self, request, *args, **kwargs):
+        serializer = self.get_serializer(self.get_object())
+        with measure_serialize(request):
+            data = serializer.data
+        return Response(data)
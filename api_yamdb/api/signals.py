@@ -0,0 +1,34 @@
+from django.contrib.auth import get_user_model
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from api.v1.cache import bump_version
+from reviews.models import Category, Comment, Genre, Review
+
+User = get_user_model()
+
+
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+@receiver(post_save, sender=Genre)
+@receiver(post_delete, sender=Genre)
+def invalidate_list_cache(sender, **kwargs):
+    bump_version(sender._meta.label_lower)
+
+
+@receiver(post_save, sender=Review)
+@receiver(post_delete, sender=Review)
+def invalidate_reviews(sender, instance, **kwargs):
+    bump_version(f'reviews:{instance.title_id}')
+
+
+@receiver(post_save, sender=Comment)
+@receiver(post_delete, sender=Comment)
+def invalidate_comments(sender, instance, **kwargs):
+    bump_version(f'comments:{instance.review_id}')
+
+
+@receiver(post_save, sender=User)
+def invalidate_authors(sender, created, **kwargs):
+    if not created:
+        bump_version(User._meta.label_lower)
@@ -0,0 +1,134 @@
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import prefetch_related_objects
+from rest_framework import status
+from rest_framework.exceptions import ValidationError
+from rest_framework.settings import api_settings
+
+from api.v1.serializers import TitleSerializer
+from reviews.deletion import raw_delete
+from reviews.models import Category, Genre, GenreTitle, Title
+
+
+def check_items(items):
+    if not isinstance(items, list):
+        raise ValidationError({api_settings.NON_FIELD_ERRORS_KEY: [
+            'Ожидается список произведений.']})
+    limit = settings.TITLES_BULK_LIMIT
+    if len(items) > limit:
+        raise ValidationError({api_settings.NON_FIELD_ERRORS_KEY: [
+            f'Не больше {limit} произведений за запрос.']})
+
+
+def get_slug_objects(items):
+    categories, genres = set(), set()
+    for item in items:
+        if not isinstance(item, dict):
+            continue
+        if isinstance(item.get('category'), str):
+            categories.add(item['category'])
+        if isinstance(item.get('genre'), list):
+            genres.update(
+                slug for slug in item['genre'] if isinstance(slug, str))
+    return {
+        Category: Category.objects.in_bulk(categories, field_name='slug'),
+        Genre: Genre.objects.in_bulk(genres, field_name='slug'),
+    }
+
+
+def get_status(results, success):
+    failed = sum('errors' in result for result in results)
+    if not failed:
+        return success
+    if failed == len(results):
+        return status.HTTP_400_BAD_REQUEST
+    return status.HTTP_207_MULTI_STATUS
+
+
+def validate_items(items, context, instances=None):
+    results = [None] * len(items)
+    valid = []
+    for index, item in enumerate(items):
+        instance = None
+        if instances is not None:
+            instance = instances.get(
+                item.get('id') if isinstance(item, dict) else None)
+            if instance is None:
+                results[index] = {
+                    'status': status.HTTP_404_NOT_FOUND,
+                    'errors': {'id': ['Произведение не найдено.']},
+                }
+                continue
+        serializer = TitleSerializer(
+            instance, data=item, partial=instance is not None,
+            context=context)
+        if serializer.is_valid():
+            valid.append((index, serializer))
+        else:
+            results[index] = {
+                'status': status.HTTP_400_BAD_REQUEST,
+                'errors': serializer.errors,
+            }
+    return results, valid
+
+
+def fill_results(results, valid, titles, context, item_status):
+    prefetch_related_objects(titles, 'genre')
+    data = TitleSerializer(titles, many=True, context=context).data
+    for (index, _), title_data in zip(valid, data):
+        results[index] = {'status': item_status, 'data': title_data}
+    return results
+
+
+def bulk_create_titles(items, context):
+    check_items(items)
+    context = {**context, 'slug_objects': get_slug_objects(items)}
+    results, valid = validate_items(items, context)
+    titles, genre_titles = [], []
+    for _, serializer in valid:
+        fields = dict(serializer.validated_data)
+        genres = dict.fromkeys(fields.pop('genre', ()))
+        title = Title(**fields)
+        titles.append(title)
+        genre_titles.extend(
+            GenreTitle(title=title, genre=genre) for genre in genres)
+    with transaction.atomic():
+        if connection.features.can_return_rows_from_bulk_insert:
+            Title.objects.bulk_create(titles)
+        else:
+            # Без RETURNING bulk_create не заполняет id произведений.
+            for title in titles:
+                title.save()
+        GenreTitle.objects.bulk_create(genre_titles)
+    return fill_results(
+        results, valid, titles, context, status.HTTP_201_CREATED)
+
+
+def bulk_update_titles(items, context):
+    check_items(items)
+    context = {**context, 'slug_objects': get_slug_objects(items)}
+    instances = Title.objects.select_related('category').in_bulk([
+        item['id'] for item in items
+        if isinstance(item, dict) and isinstance(item.get('id'), int)
+    ])
+    results, valid = validate_items(items, context, instances)
+    titles, fields, genres = [], set(), {}
+    for _, serializer in valid:
+        title = serializer.instance
+        for name, value in serializer.validated_data.items():
+            if name == 'genre':
+                genres[title.pk] = dict.fromkeys(value)
+            else:
+                setattr(title, name, value)
+                fields.add(name)
+        titles.append(title)
+    with transaction.atomic():
+        if fields:
+            Title.objects.bulk_update(set(titles), fields)
+        if genres:
+            raw_delete(GenreTitle.objects.filter(title_id__in=genres))
+            GenreTitle.objects.bulk_create(
+                GenreTitle(title_id=pk, genre=genre)
+                for pk, title_genres in genres.items()
+                for genre in title_genres)
+    return fill_results(results, valid, titles, context, status.HTTP_200_OK)
@@ -0,0 +1,134 @@
+import time
+from hashlib import md5
+from uuid import uuid4
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Count, Max
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
+from rest_framework.response import Response
+
+VERSION_KEY = 'api:version:{}'
+
+
+def get_versions(*names):
+    keys = [VERSION_KEY.format(name) for name in names]
+    states = cache.get_many(keys)
+    for key in keys:
+        if key not in states:
+            cache.add(key, (uuid4().hex, int(time.time())),
+                      settings.API_VERSION_TIMEOUT)
+            states[key] = cache.get(key)
+    return [states[key] for key in keys]
+
+
+def bump_version(*names):
+    def bump():
+        state = (uuid4().hex, int(time.time()))
+        cache.set_many({VERSION_KEY.format(name): state for name in names},
+                       settings.API_VERSION_TIMEOUT)
+
+    # До фиксации транзакции параллельный запрос прочитал бы новую версию
+    # вместе со старыми данными и закрепил бы их под новым ETag.
+    transaction.on_commit(bump)
+
+
+def make_etag(*parts):
+    return '"{}"'.format(md5(':'.join(map(str, parts)).encode()).hexdigest())
+
+
+def get_conditional_etag(request, names, validator=()):
+    versions = get_versions(*names)
+    etag = make_etag(
+        request.path,
+        request.accepted_renderer.format,
+        sorted(request.query_params.lists()),
+        *(version for version, _ in versions),
+        *validator,
+    )
+    return etag, max((modified for _, modified in versions), default=None)
+
+
+def row_state(instance):
+    state = [
+        instance.__dict__.get(field.attname)
+        for field in instance._meta.concrete_fields
+    ]
+    for name, related in sorted(instance._state.fields_cache.items()):
+        state.append((name, related and row_state(related)))
+    prefetched = getattr(instance, '_prefetched_objects_cache', {})
+    for name, objects in sorted(prefetched.items()):
+        state.append((name, [row_state(obj) for obj in objects]))
+    return state
+
+
+def children_state(relation, visible):
+    return {
+        'children': Count(relation, filter=visible),
+        'last_pub_date': Max(f'{relation}__pub_date', filter=visible),
+        'last_id': Max(f'{relation}__id', filter=visible),
+    }
+
+
+def set_validators(response, etag, last_modified=None):
+    response['ETag'] = etag
+    if last_modified is not None:
+        response['Last-Modified'] = http_date(last_modified)
+    return response
+
+
+class CachedListMixin:
+    cache_timeout = getattr(settings, 'API_CACHE_TIMEOUT', 300)
+
+    def list(self, request, *args, **kwargs):
+        etag, last_modified = get_conditional_etag(
+            request, [self.queryset.model._meta.label_lower])
+        not_modified = get_conditional_response(
+            request._request, etag=etag, last_modified=last_modified)
+        if not_modified is not None:
+            return set_validators(not_modified, etag, last_modified)
+
+        # Ссылки next/previous в ответе абсолютные, поэтому кеш зависит
+        # от схемы и хоста запроса, а не только от ETag.
+        key = f'api:list:{request.scheme}://{request.get_host()}:{etag}'
+        data = cache.get(key)
+        if data is None:
+            response = super().list(request, *args, **kwargs)
+            cache.set(key, response.data, self.cache_timeout)
+        else:
+            response = Response(data)
+        return set_validators(response, etag, last_modified)
+
+
+class ConditionalGetMixin:
+    def get_version_names(self):
+        return None
+
+    def get_validator(self):
+        return ()
+
+    def conditional(self, handler, request, *args, **kwargs):
+        names = self.get_version_names()
+        if names is None:
+            return handler(request, *args, **kwargs)
+        # Состояние строк читается из базы вместе с родителем: удаленный
+        # ресурс дает 404, а изменения в обход сигналов меняют ETag.
+        # Версии в кеше покрывают только правки текста и связанных имен,
+        # поэтому Last-Modified по ним не выставляется.
+        etag, _ = get_conditional_etag(
+            request, names, self.get_validator())
+        not_modified = get_conditional_response(request._request, etag=etag)
+        if not_modified is not None:
+            return set_validators(not_modified, etag)
+        response = handler(request, *args, **kwargs)
+        if response.status_code == 200:
+            set_validators(response, etag)
+        return response
+
+    def list(self, request, *args, **kwargs):
+        return self.conditional(super().list, request, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        return self.conditional(super().retrieve, request, *args, **kwargs)
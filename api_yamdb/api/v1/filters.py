@@ -1,15 +1,69 @@
-from django_filters.rest_framework import CharFilter, FilterSet
+from django.conf import settings
+from django.core.cache import cache
+from django_filters.rest_framework import BaseInFilter, CharFilter, FilterSet
 
-from reviews.models import Title
+from api.v1.cache import get_versions
+from reviews.models import Category, Genre, GenreTitle, Title
+
+SLUG_IDS_KEY = 'api:slugs:{}:{}'
+
+
+class CharInFilter(BaseInFilter, CharFilter):
+    pass
+
+
+def get_slug_ids(model):
+    label = model._meta.label_lower
+    (version, _), = get_versions(label)
+    key = SLUG_IDS_KEY.format(label, version)
+    ids = cache.get(key)
+    if ids is None:
+        ids = dict(model.objects.values_list('slug', 'id'))
+        cache.set(key, ids, settings.API_CACHE_TIMEOUT)
+    return ids
+
+
+def resolve_slugs(model, slugs, prefix=False):
+    ids = get_slug_ids(model)
+    if prefix:
+        return [pk for slug, pk in ids.items()
+                if any(slug.startswith(value) for value in slugs)]
+    missing = [slug for slug in slugs if slug not in ids]
+    found = [ids[slug] for slug in slugs if slug in ids]
+    if missing:
+        # Объекты, созданные в обход сигналов, ещё не попали в карту.
+        found.extend(model.objects.filter(
+            slug__in=missing).values_list('id', flat=True))
+    return found
 
 
 class TitleFilter(FilterSet):
-    category = CharFilter(
+    category = CharFilter(method='filter_category')
+    category__in = CharInFilter(method='filter_category')
+    category__startswith = CharFilter(method='filter_category')
+    category__icontains = CharFilter(
         field_name='category__slug',
         lookup_expr='icontains')
-    genre = CharFilter(field_name='genre__slug')
+    genre = CharFilter(method='filter_genre')
+    genre__in = CharInFilter(method='filter_genre')
     name = CharFilter(field_name='name')
 
     class Meta:
         model = Title
         fields = ('name', 'year', 'genre', 'category',)
+
+    def get_ids(self, model, name, value):
+        return resolve_slugs(
+            model,
+            value if isinstance(value, list) else [value],
+            prefix=name.endswith('__startswith'),
+        )
+
+    def filter_category(self, queryset, name, value):
+        return queryset.filter(
+            category_id__in=self.get_ids(Category, name, value))
+
+    def filter_genre(self, queryset, name, value):
+        return queryset.filter(id__in=GenreTitle.objects.filter(
+            genre_id__in=self.get_ids(Genre, name, value)
+        ).values('title_id'))
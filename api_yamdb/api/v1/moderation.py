@@ -0,0 +1,57 @@
+from django.db import transaction
+
+from api.v1.cache import bump_version
+from reviews.deletion import raw_delete
+from reviews.models import Comment, Review, Title
+from reviews.ratings import recalculate_ratings
+
+
+def select_objects(model, data):
+    filters = {}
+    if 'ids' in data:
+        filters['pk__in'] = data['ids']
+    if 'author' in data:
+        filters['author'] = data['author']
+    if 'since' in data:
+        filters['pub_date__gte'] = data['since']
+    if 'until' in data:
+        filters['pub_date__lt'] = data['until']
+    queryset = model.objects.filter(**filters).order_by()
+    if data['action'] != 'delete':
+        queryset = queryset.exclude(is_hidden=data['action'] == 'hide')
+    return queryset
+
+
+def moderate_reviews(data):
+    reviews = select_objects(Review, data)
+    comments = 0
+    with transaction.atomic():
+        title_ids = set(
+            reviews.values_list('title_id', flat=True).distinct())
+        if data['action'] == 'delete':
+            # Комментарии удаляются первыми: подзапрос по отзывам должен
+            # выполниться до их удаления.
+            comments = raw_delete(
+                Comment.objects.filter(review__in=reviews.values('pk')))
+            count = raw_delete(reviews)
+        else:
+            count = reviews.update(is_hidden=data['action'] == 'hide')
+        if title_ids:
+            recalculate_ratings(Title.objects.filter(pk__in=title_ids))
+    if title_ids:
+        bump_version(*(f'reviews:{pk}' for pk in title_ids))
+    return {'reviews': count, 'comments': comments, 'titles': len(title_ids)}
+
+
+def moderate_comments(data):
+    comments = select_objects(Comment, data)
+    with transaction.atomic():
+        review_ids = set(
+            comments.values_list('review_id', flat=True).distinct())
+        if data['action'] == 'delete':
+            count = raw_delete(comments)
+        else:
+            count = comments.update(is_hidden=data['action'] == 'hide')
+    if review_ids:
+        bump_version(*(f'comments:{pk}' for pk in review_ids))
+    return {'comments': count, 'reviews': len(review_ids)}
@@ -0,0 +1,44 @@
+from django.db.models import QuerySet
+from django.shortcuts import get_object_or_404
+
+
+class NestedParentMixin:
+    parents = ()
+
+    def get_parent_queryset(self):
+        *ancestors, (name, parent) = self.parents
+        path = []
+        filters = {'pk': self.kwargs.get(f'{name}_id')}
+        for ancestor, _ in reversed(ancestors):
+            path.append(ancestor)
+            filters[f'{"__".join(path)}_id'] = self.kwargs.get(
+                f'{ancestor}_id')
+        if not isinstance(parent, QuerySet):
+            parent = parent._default_manager.all()
+        return parent.filter(**filters)
+
+    def get_parent_annotations(self):
+        return {}
+
+    def get_parents(self):
+        if not hasattr(self, '_parents'):
+            *ancestors, (name, _) = self.parents
+            path = [ancestor for ancestor, _ in reversed(ancestors)]
+            queryset = self.get_parent_queryset().annotate(
+                **self.get_parent_annotations())
+            if path:
+                queryset = queryset.select_related('__'.join(path))
+            parent = get_object_or_404(queryset)
+            self._parents = {name: parent}
+            for ancestor in path:
+                parent = getattr(parent, ancestor)
+                self._parents[ancestor] = parent
+        return self._parents
+
+    def get_parent(self, name=None):
+        return self.get_parents()[name or self.parents[-1][0]]
+
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        context.update(self.get_parents())
+        return context
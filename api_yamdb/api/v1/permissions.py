@@ -28,5 +28,12 @@ class IsAdminOrAuthorOrReadOnly(BasePermission):
             request.method in SAFE_METHODS
             or request.user.is_admin
             or request.user.is_moderator
-            or obj.author == request.user
+            or obj.author_id == request.user.pk
         )
+
+
+class IsModeratorOrAdmin(BasePermission):
+
+    def has_permission(self, request, view):
+        return request.user.is_authenticated and (request.user.is_admin
+                                                  or request.user.is_moderator)
@@ -0,0 +1,60 @@
+import re
+from functools import reduce
+from operator import and_, or_
+
+from django.db import connection
+from django.db.models import Q
+from rest_framework.filters import BaseFilterBackend
+
+TERM_PATTERN = re.compile(r'\w+')
+
+
+def fts_table(table):
+    return f'{table}_fts'
+
+
+def search_vector(fields):
+    from django.contrib.postgres.search import SearchVector
+    return SearchVector(*fields, config='simple')
+
+
+def full_text_search(queryset, query, fields):
+    terms = TERM_PATTERN.findall(query)
+    if not terms:
+        return queryset.none()
+    if connection.vendor == 'sqlite':
+        table = queryset.model._meta.db_table
+        fts = fts_table(table)
+        return queryset.extra(
+            tables=[fts],
+            where=[f'{fts}.rowid = {table}.id', f'{fts} MATCH %s'],
+            params=[' '.join(f'"{term}"*' for term in terms)],
+            select={'search_rank': f'{fts}.rank'},
+            order_by=['search_rank'],
+        )
+    if connection.vendor == 'postgresql':
+        from django.contrib.postgres.search import SearchQuery, SearchRank
+        vector = search_vector(fields)
+        search_query = SearchQuery(
+            ' & '.join(f'{term}:*' for term in terms),
+            config='simple',
+            search_type='raw',
+        )
+        return queryset.annotate(
+            search=vector,
+            search_rank=SearchRank(vector, search_query),
+        ).filter(search=search_query).order_by('-search_rank')
+    return queryset.filter(reduce(and_, (
+        reduce(or_, (Q(**{f'{field}__icontains': term}) for field in fields))
+        for term in terms
+    )))
+
+
+class FullTextSearchFilter(BaseFilterBackend):
+    search_param = 'search'
+
+    def filter_queryset(self, request, queryset, view):
+        query = request.query_params.get(self.search_param, '').strip()
+        if not query:
+            return queryset
+        return full_text_search(queryset, query, view.search_fields)
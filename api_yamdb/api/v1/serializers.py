@@ -1,19 +1,89 @@
+from operator import attrgetter
+
+from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.contrib.auth.tokens import default_token_generator
-from django.core.exceptions import ValidationError
-from django.shortcuts import get_object_or_404
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.db import IntegrityError, models, transaction
+from django.db.models import Q
+from django.utils.encoding import smart_str
 from rest_framework import serializers
-from rest_framework.fields import CharField, EmailField
-from rest_framework.serializers import (ModelSerializer, Serializer,
-                                        SlugRelatedField)
+from rest_framework.fields import (CharField, ChoiceField, DateTimeField,
+                                   EmailField, Field, IntegerField, ListField)
+from rest_framework.relations import ManyRelatedField, RelatedField
+from rest_framework.serializers import (ListSerializer, ModelSerializer,
+                                        Serializer, SlugRelatedField)
+from rest_framework.settings import api_settings
 
 from api.v1.validators import validator
 from reviews.models import Category, Comment, Genre, Review, Title
-from users.models import MAX_LENGTH
+from users.models import MAX_LENGTH, UserRemoval
+from users.outbox import enqueue_email
 
 User = get_user_model()
 
 
+def get_prefetched(attr, default):
+    def getter(instance):
+        try:
+            return instance._prefetched_objects_cache[attr]
+        except (AttributeError, KeyError):
+            return default(instance)
+    return getter
+
+
+def get_plan_getter(field, model):
+    if len(field.source_attrs) != 1:
+        return field.get_attribute
+    attr = field.source_attrs[0]
+    try:
+        model_field = model._meta.get_field(attr)
+    except FieldDoesNotExist:
+        model_field = None
+    if isinstance(field, ManyRelatedField):
+        # Менеджер связи создаётся на каждый объект, поэтому берём
+        # результат prefetch_related напрямую.
+        if (model_field is not None and model_field.many_to_many
+                and not model_field.auto_created):
+            return get_prefetched(attr, field.get_attribute)
+        return field.get_attribute
+    getter = type(field).get_attribute
+    if not (
+        getter is Field.get_attribute
+        or (getter is RelatedField.get_attribute
+            and not field.use_pk_only_optimization())
+    ):
+        return field.get_attribute
+    if model_field is None and not isinstance(
+            getattr(model, attr, None), property):
+        return field.get_attribute
+    return attrgetter(attr)
+
+
+class FastListSerializer(ListSerializer):
+
+    def get_plan(self):
+        model = self.child.Meta.model
+        return [
+            (field.field_name, get_plan_getter(field, model),
+             field.to_representation)
+            for field in self.child._readable_fields
+        ]
+
+    def to_representation(self, data):
+        iterable = data.all() if isinstance(data, models.Manager) else data
+        plan = self.get_plan()
+        rows = []
+        for instance in iterable:
+            row = {}
+            for name, getter, to_representation in plan:
+                value = getter(instance)
+                row[name] = (
+                    None if value is None else to_representation(value))
+            rows.append(row)
+        return rows
+
+
 class UserSerializer(ModelSerializer):
     class Meta:
         fields = ('username', 'email', 'first_name', 'last_name', 'bio',
@@ -26,6 +96,13 @@ class UserEditSerializer(UserSerializer):
         read_only_fields = ('role',)
 
 
+class UserRemovalSerializer(ModelSerializer):
+    class Meta:
+        model = UserRemoval
+        fields = ('username', 'created', 'deleted_reviews', 'deleted_comments',
+                  'finished')
+
+
 class SignUpSerializer(Serializer):
     username = CharField(
         max_length=MAX_LENGTH,
@@ -38,17 +115,33 @@ class SignUpSerializer(Serializer):
     )
 
     def validate(self, data):
-        email = User.objects.filter(email=data.get('email')).first()
-        username = User.objects.filter(username=data.get('username')).first()
-        if email != username:
-            raise ValidationError('Эти username или email уже заняты')
+        users = User.objects.filter(
+            Q(email=data.get('email')) | Q(username=data.get('username'))
+        ).order_by()[:2]
+        self.user = None
+        for user in users:
+            if (user.email, user.username) != (data.get('email'),
+                                               data.get('username')):
+                raise ValidationError('Эти username или email уже заняты')
+            self.user = user
         return data
 
+    @transaction.atomic
     def create(self, validated_data):
-        user, created = User.objects.get_or_create(**validated_data)
-        user.email_user(
-            subject='confirmation_code',
-            message=default_token_generator.make_token(user),
+        user = self.user
+        if user is None:
+            try:
+                with transaction.atomic():
+                    user = User.objects.create(**validated_data)
+            except IntegrityError:
+                user = User.objects.filter(**validated_data).first()
+                if user is None:
+                    raise serializers.ValidationError(
+                        'Эти username или email уже заняты')
+        enqueue_email(
+            user.email,
+            'confirmation_code',
+            default_token_generator.make_token(user),
         )
         return {
             'email': user.email,
@@ -75,19 +168,20 @@ class ReviewSerializer(serializers.ModelSerializer):
     class Meta:
         fields = ('id', 'text', 'author', 'score', 'pub_date')
         model = Review
+        list_serializer_class = FastListSerializer
 
-    def validate(self, data):
-        if self.context.get('request').method != 'POST':
-            return data
-        title_id = self.context['view'].kwargs.get('title_id')
-        author = self.context.get('request').user
-        title = get_object_or_404(Title, id=title_id)
-        if self.context.get('request').method != 'PATCH':
-            if title.reviews.filter(author=author).exists():
-                raise serializers.ValidationError(
-                    'Ваш отзыв уже есть.'
-                )
-        return data
+    def create(self, validated_data):
+        try:
+            with transaction.atomic():
+                return super().create(validated_data)
+        except IntegrityError:
+            if not Review.objects.filter(
+                title_id=validated_data['title'].pk,
+                author_id=validated_data['author'].pk,
+            ).exists():
+                raise
+        raise serializers.ValidationError(
+            {api_settings.NON_FIELD_ERRORS_KEY: ['Ваш отзыв уже есть.']})
 
 
 class CommentSerializer(ModelSerializer):
@@ -98,6 +192,33 @@ class CommentSerializer(ModelSerializer):
     class Meta:
         model = Comment
         fields = ('id', 'text', 'author', 'pub_date')
+        list_serializer_class = FastListSerializer
+
+
+class ModerationSerializer(Serializer):
+    action = ChoiceField(choices=('delete', 'hide', 'restore'))
+    ids = ListField(child=IntegerField(min_value=1), required=False)
+    author = SlugRelatedField(
+        slug_field='username', queryset=User.objects.all(), required=False)
+    since = DateTimeField(required=False)
+    until = DateTimeField(required=False)
+
+    def validate_ids(self, value):
+        limit = settings.MODERATION_IDS_LIMIT
+        if len(value) > limit:
+            raise serializers.ValidationError(
+                f'Не больше {limit} идентификаторов за запрос.')
+        return value
+
+    def validate(self, data):
+        if not data.keys() & {'ids', 'author', 'since', 'until'}:
+            raise serializers.ValidationError(
+                'Укажите ids, author или интервал времени since/until.')
+        if data.keys() >= {'since', 'until'} and (
+                data['since'] >= data['until']):
+            raise serializers.ValidationError(
+                'Начало интервала должно быть раньше конца.')
+        return data
 
 
 class CategorySerializer(ModelSerializer):
@@ -106,10 +227,25 @@ class CategorySerializer(ModelSerializer):
         fields = ('name', 'slug')
 
 
-class CategoryField(SlugRelatedField):
+class PrefetchedSlugField(SlugRelatedField):
+
+    def to_internal_value(self, data):
+        objects = self.context.get('slug_objects', {}).get(
+            self.queryset.model)
+        if objects is None:
+            return super().to_internal_value(data)
+        try:
+            return objects[data]
+        except (KeyError, TypeError):
+            self.fail('does_not_exist', slug_name=self.slug_field,
+                      value=smart_str(data))
 
     def to_representation(self, value):
-        return CategorySerializer(value).data
+        return {'name': value.name, 'slug': value.slug}
+
+
+class CategoryField(PrefetchedSlugField):
+    pass
 
 
 class GenreSerializer(ModelSerializer):
@@ -119,10 +255,8 @@ class GenreSerializer(ModelSerializer):
         ordering = ('name',)
 
 
-class GenreField(SlugRelatedField):
-
-    def to_representation(self, value):
-        return GenreSerializer(value).data
+class GenreField(PrefetchedSlugField):
+    pass
 
 
 class TitleSerializer(ModelSerializer):
@@ -146,3 +280,4 @@ class TitleSerializer(ModelSerializer):
         model = Title
         fields = (
             'id', 'name', 'year', 'rating', 'description', 'genre', 'category')
+        list_serializer_class = FastListSerializer
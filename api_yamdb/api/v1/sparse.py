@@ -0,0 +1,110 @@
+from django.core.exceptions import FieldDoesNotExist
+from rest_framework.exceptions import ValidationError
+from rest_framework.permissions import SAFE_METHODS
+
+FIELDS_PARAM = 'fields'
+OMIT_PARAM = 'omit'
+EXPAND_PARAM = 'expand'
+
+
+def get_param_names(request, param):
+    return {
+        name.strip()
+        for value in request.query_params.getlist(param)
+        for name in value.split(',')
+        if name.strip()
+    }
+
+
+def check_names(param, names, allowed):
+    unknown = names - set(allowed)
+    if unknown:
+        raise ValidationError({param: [
+            f'Неизвестное поле: {name}' for name in sorted(unknown)]})
+
+
+def get_requested_fields(request, available, expandable=()):
+    if request is None or request.method not in SAFE_METHODS:
+        return None
+    fields = get_param_names(request, FIELDS_PARAM)
+    omit = get_param_names(request, OMIT_PARAM)
+    expand = get_param_names(request, EXPAND_PARAM)
+    check_names(FIELDS_PARAM, fields, available)
+    check_names(OMIT_PARAM, omit, available)
+    check_names(EXPAND_PARAM, expand, expandable)
+    if not fields and not omit:
+        return None
+    selected = (fields | expand) if fields else set(available)
+    return [name for name in available
+            if name in selected and name not in omit]
+
+
+def get_columns(model, names, field_columns, required_columns):
+    columns = set(required_columns)
+    for name in names:
+        columns.update(field_columns.get(name, (name,)))
+    concrete = []
+    for column in sorted(columns):
+        try:
+            field = model._meta.get_field(column)
+        except FieldDoesNotExist:
+            continue
+        if field.concrete and not field.many_to_many:
+            concrete.append(column)
+    return concrete
+
+
+def prune_queryset(queryset, names, field_columns=None,
+                   required_columns=()):
+    field_columns = field_columns or {}
+    relations = set()
+    for name in names:
+        relations.update(field_columns.get(name, (name,)))
+    select_related = queryset.query.select_related
+    if isinstance(select_related, dict):
+        lookups = [lookup for lookup in select_related
+                   if lookup in relations]
+        queryset = queryset.select_related(None)
+        if lookups:
+            queryset = queryset.select_related(*lookups)
+    prefetch = queryset._prefetch_related_lookups
+    if prefetch:
+        queryset = queryset.prefetch_related(None).prefetch_related(*(
+            lookup for lookup in prefetch
+            if getattr(lookup, 'prefetch_to', lookup).split('__')[0]
+            in relations))
+    return queryset.only(*get_columns(
+        queryset.model, names, field_columns, required_columns))
+
+
+class SparseFieldsMixin:
+    expandable_fields = ()
+    field_columns = {}
+    required_columns = ()
+
+    def get_sparse_fields(self):
+        if not hasattr(self, '_sparse_fields'):
+            self._sparse_fields = get_requested_fields(
+                self.request,
+                self.get_serializer_class().Meta.fields,
+                self.expandable_fields,
+            )
+        return self._sparse_fields
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        names = self.get_sparse_fields()
+        if names is None:
+            return queryset
+        return prune_queryset(
+            queryset, names, self.field_columns, self.required_columns)
+
+    def get_serializer(self, *args, **kwargs):
+        serializer = super().get_serializer(*args, **kwargs)
+        names = self.get_sparse_fields()
+        if names is not None:
+            fields = getattr(serializer, 'child', serializer).fields
+            for name in list(fields):
+                if name not in names:
+                    fields.pop(name)
+        return serializer
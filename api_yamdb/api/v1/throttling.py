@@ -0,0 +1,100 @@
+import hashlib
+import time
+
+from django.conf import settings
+from django.core.cache import cache as default_cache
+from django.core.exceptions import ImproperlyConfigured
+from rest_framework.settings import api_settings
+from rest_framework.throttling import SimpleRateThrottle
+
+
+class SlidingWindowThrottle(SimpleRateThrottle):
+    cache = default_cache
+    timer = time.time
+
+    def get_rate(self):
+        try:
+            return settings.AUTH_THROTTLE_RATES[self.scope]
+        except KeyError:
+            raise ImproperlyConfigured(
+                f'Не задан лимит запросов для "{self.scope}"')
+
+    def estimate(self):
+        weight = 1 - self.elapsed / self.duration
+        return self.previous * weight + self.current
+
+    def allow_request(self, request, view):
+        if self.rate is None:
+            return True
+        self.key = self.get_cache_key(request, view)
+        if self.key is None:
+            return True
+        window, self.elapsed = divmod(self.timer(), self.duration)
+        current_key = f'{self.key}:{int(window)}'
+        previous_key = f'{self.key}:{int(window) - 1}'
+        counts = self.cache.get_many([previous_key, current_key])
+        self.previous = counts.get(previous_key, 0)
+        self.current = counts.get(current_key, 0)
+        if self.estimate() >= self.num_requests:
+            return self.throttle_failure()
+        if not self.cache.add(current_key, 1, self.duration * 2):
+            try:
+                self.cache.incr(current_key)
+            except ValueError:
+                self.cache.set(current_key, 1, self.duration * 2)
+        return True
+
+    def wait(self):
+        if self.current >= self.num_requests:
+            # В следующем окне текущий счётчик станет предыдущим.
+            return (self.duration - self.elapsed + self.duration * (
+                1 - self.num_requests / self.current))
+        return max(0, self.duration * (
+            1 - (self.num_requests - self.current) / self.previous
+        ) - self.elapsed)
+
+
+class IPThrottle(SlidingWindowThrottle):
+
+    def get_ident(self, request):
+        # Без NUM_PROXIES DRF берет адрес из X-Forwarded-For, который
+        # клиент подставляет сам, и обходит лимит.
+        if api_settings.NUM_PROXIES is None:
+            return request.META.get('REMOTE_ADDR')
+        return super().get_ident(request)
+
+    def get_cache_key(self, request, view):
+        return self.cache_format % {
+            'scope': self.scope,
+            'ident': self.get_ident(request),
+        }
+
+
+class UsernameThrottle(SlidingWindowThrottle):
+
+    def get_cache_key(self, request, view):
+        if not isinstance(request.data, dict):
+            return None
+        username = request.data.get('username')
+        if not isinstance(username, str) or not username:
+            return None
+        return self.cache_format % {
+            'scope': self.scope,
+            'ident': hashlib.md5(username.lower().encode()).hexdigest(),
+        }
+
+
+class SignUpIPThrottle(IPThrottle):
+    scope = 'signup_ip'
+
+
+class SignUpUsernameThrottle(UsernameThrottle):
+    scope = 'signup_username'
+
+
+class TokenIPThrottle(IPThrottle):
+    scope = 'token_ip'
+
+
+class TokenUsernameThrottle(UsernameThrottle):
+    scope = 'token_username'
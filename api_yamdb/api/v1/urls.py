@@ -3,6 +3,7 @@ from rest_framework.routers import DefaultRouter
 
 from api.v1.views import (CategoryViewSet, CommentViewSet, GenreViewSet,
                           ReviewViewSet, TitleViewSet, UserViewSet, get_token,
+                          metrics, moderation_comments, moderation_reviews,
                           signup)
 
 router_v1 = DefaultRouter()
@@ -21,7 +22,14 @@ auth_urls = [
     path('token/', get_token, name='get_token'),
 ]
 
+moderation_urls = [
+    path('reviews/', moderation_reviews, name='moderation_reviews'),
+    path('comments/', moderation_comments, name='moderation_comments'),
+]
+
 urlpatterns = [
     path('', include(router_v1.urls)),
     path('auth/', include(auth_urls)),
+    path('moderation/', include(moderation_urls)),
+    path('metrics/', metrics, name='metrics'),
 ]
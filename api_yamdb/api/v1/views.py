@@ -1,46 +1,81 @@
 from django.contrib.auth import get_user_model
 from django.contrib.auth.tokens import default_token_generator
-from django.db.models import Avg
+from django.db.models import Q
+from django.http import Http404
 from django.shortcuts import get_object_or_404
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework import status, viewsets
-from rest_framework.decorators import action, api_view
+from rest_framework.decorators import (action, api_view, permission_classes,
+                                       throttle_classes)
 from rest_framework.filters import SearchFilter
-from rest_framework.mixins import (CreateModelMixin, DestroyModelMixin,
-                                   ListModelMixin)
+from rest_framework.mixins import CreateModelMixin, DestroyModelMixin
 from rest_framework.pagination import PageNumberPagination
-from rest_framework.permissions import IsAuthenticated
+from rest_framework.permissions import SAFE_METHODS, IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.viewsets import GenericViewSet
-from rest_framework_simplejwt.tokens import AccessToken
 
+from api.metrics import ListMetricsMixin, RetrieveMetricsMixin, registry
+from api.v1.bulk import bulk_create_titles, bulk_update_titles, get_status
+from api.v1.cache import (CachedListMixin, ConditionalGetMixin, children_state,
+                          row_state)
 from api.v1.filters import TitleFilter
+from api.v1.moderation import moderate_comments, moderate_reviews
+from api.v1.nested import NestedParentMixin
+from api.v1.pagination import PageNumberOrKeysetPagination
 from api.v1.permissions import (IsAdminAndAuthenticated,
-                                IsAdminOrAuthorOrReadOnly, IsAdminOrReadOnly)
+                                IsAdminOrAuthorOrReadOnly, IsAdminOrReadOnly,
+                                IsModeratorOrAdmin)
+from api.v1.search import FullTextSearchFilter
 from api.v1.serializers import (CategorySerializer, CommentSerializer,
-                                GenreSerializer, ReviewSerializer,
-                                SignUpSerializer, TitleSerializer,
-                                TokenSerializer, UserEditSerializer,
+                                GenreSerializer, ModerationSerializer,
+                                ReviewSerializer, SignUpSerializer,
+                                TitleSerializer, TokenSerializer,
+                                UserEditSerializer, UserRemovalSerializer,
                                 UserSerializer)
+from api.v1.sparse import SparseFieldsMixin
+from api.v1.throttling import (SignUpIPThrottle, SignUpUsernameThrottle,
+                               TokenIPThrottle, TokenUsernameThrottle)
 from reviews.models import Category, Genre, Review, Title
+from users.authentication import get_access_token
+from users.cache import user_cache
+from users.removal import remove_user
 
 User = get_user_model()
 
 
-class UserTitleReviewCommentBase(viewsets.ModelViewSet):
+class UserTitleReviewCommentBase(ListMetricsMixin, RetrieveMetricsMixin,
+                                 viewsets.ModelViewSet):
     http_method_names = ('delete', 'get', 'patch', 'post')
 
 
 class UserViewSet(UserTitleReviewCommentBase):
-    queryset = User.objects.all()
+    queryset = User.objects.filter(is_active=True)
     serializer_class = UserSerializer
     pagination_class = PageNumberPagination
     permission_classes = (IsAdminAndAuthenticated,)
-    filter_backends = (SearchFilter,)
+    filter_backends = (FullTextSearchFilter,)
     filterset_fields = ('username')
-    search_fields = ('username',)
+    search_fields = ('username', 'email')
     lookup_field = 'username'
 
+    def get_object(self):
+        if self.request.method not in SAFE_METHODS:
+            # save() пишет все поля, поэтому изменять можно только свежую
+            # строку, а не копию из кеша процесса.
+            return super().get_object()
+        user = user_cache.get_by_username(self.kwargs[self.lookup_field])
+        if user is None or not user.is_active:
+            raise Http404
+        self.check_object_permissions(self.request, user)
+        return user
+
+    def destroy(self, request, *args, **kwargs):
+        removal = remove_user(self.get_object())
+        if removal is None:
+            return Response(status=status.HTTP_204_NO_CONTENT)
+        return Response(UserRemovalSerializer(removal).data,
+                        status=status.HTTP_202_ACCEPTED)
+
     @action(
         methods=['get', 'patch'],
         detail=False,
@@ -52,7 +87,8 @@ class UserViewSet(UserTitleReviewCommentBase):
         user = request.user
         if request.method == 'PATCH':
             serializer = UserEditSerializer(
-                user, data=request.data, partial=True
+                get_object_or_404(User, pk=user.pk), data=request.data,
+                partial=True
             )
             serializer.is_valid(raise_exception=True)
             serializer.save()
@@ -62,6 +98,7 @@ class UserViewSet(UserTitleReviewCommentBase):
 
 
 @api_view(['POST'])
+@throttle_classes((SignUpIPThrottle, SignUpUsernameThrottle))
 def signup(request):
     serializer = SignUpSerializer(data=request.data)
     serializer.is_valid(raise_exception=True)
@@ -70,6 +107,7 @@ def signup(request):
 
 
 @api_view(['POST'])
+@throttle_classes((TokenIPThrottle, TokenUsernameThrottle))
 def get_token(request):
     serializer = TokenSerializer(data=request.data)
     serializer.is_valid(raise_exception=True)
@@ -81,15 +119,41 @@ def get_token(request):
     if not default_token_generator.check_token(user, confirmation_code):
         mesage = {'confirmation_code': 'Невалиден код подтверждения'}
         return Response(mesage, status=status.HTTP_400_BAD_REQUEST)
-    token = AccessToken.for_user(user)
+    token = get_access_token(user)
     return Response({'token': str(token)})
 
 
+@api_view(['GET'])
+@permission_classes((IsAdminAndAuthenticated,))
+def metrics(request):
+    return Response({
+        'routes': registry.summary(),
+        'user_cache': user_cache.stats(),
+    })
+
+
+@api_view(['POST'])
+@permission_classes((IsModeratorOrAdmin,))
+def moderation_reviews(request):
+    serializer = ModerationSerializer(data=request.data)
+    serializer.is_valid(raise_exception=True)
+    return Response(moderate_reviews(serializer.validated_data))
+
+
+@api_view(['POST'])
+@permission_classes((IsModeratorOrAdmin,))
+def moderation_comments(request):
+    serializer = ModerationSerializer(data=request.data)
+    serializer.is_valid(raise_exception=True)
+    return Response(moderate_comments(serializer.validated_data))
+
+
 class CreateDestroyListCategoryGenre(
+        CachedListMixin,
         GenericViewSet,
         CreateModelMixin,
         DestroyModelMixin,
-        ListModelMixin
+        ListMetricsMixin
 ):
     filter_backends = (SearchFilter,)
     lookup_field = 'slug'
@@ -97,13 +161,48 @@ class CreateDestroyListCategoryGenre(
     permission_classes = (IsAdminOrReadOnly,)
 
 
-class TitleViewSet(UserTitleReviewCommentBase):
-    queryset = Title.objects.annotate(rating=Avg('reviews__score')
-                                      ).order_by('name')
+class TitleViewSet(ConditionalGetMixin, SparseFieldsMixin,
+                   UserTitleReviewCommentBase):
+    queryset = Title.objects.select_related('category').prefetch_related(
+        'genre').order_by('name')
     serializer_class = TitleSerializer
     permission_classes = (IsAdminOrReadOnly,)
-    filter_backends = (DjangoFilterBackend,)
+    filter_backends = (DjangoFilterBackend, FullTextSearchFilter)
     filterset_class = TitleFilter
+    search_fields = ('name', 'description')
+    expandable_fields = ('genre', 'category')
+    field_columns = {'rating': ('rating_sum', 'rating_count')}
+
+    def get_version_names(self):
+        if self.action != 'retrieve':
+            return None
+        return ()
+
+    def get_object(self):
+        if not hasattr(self, '_object'):
+            self._object = super().get_object()
+        return self._object
+
+    def get_validator(self):
+        return row_state(self.get_object())
+
+    @action(
+        methods=['post', 'patch'],
+        detail=False,
+        url_path='bulk',
+        permission_classes=(IsAdminAndAuthenticated,),
+    )
+    def bulk(self, request):
+        if request.method == 'POST':
+            results = bulk_create_titles(
+                request.data, self.get_serializer_context())
+            success = status.HTTP_201_CREATED
+        else:
+            results = bulk_update_titles(
+                request.data, self.get_serializer_context())
+            success = status.HTTP_200_OK
+        return Response(
+            {'results': results}, status=get_status(results, success))
 
 
 class CategoryViewSet(CreateDestroyListCategoryGenre):
@@ -116,36 +215,71 @@ class GenreViewSet(CreateDestroyListCategoryGenre):
     serializer_class = GenreSerializer
 
 
-class ReviewCommentPermissionsBase(viewsets.ModelViewSet):
+class ReviewCommentPermissionsBase(ListMetricsMixin, RetrieveMetricsMixin,
+                                   viewsets.ModelViewSet):
     permission_classes = (IsAdminOrAuthorOrReadOnly,)
+    pagination_class = PageNumberOrKeysetPagination
 
 
-class ReviewViewSet(UserTitleReviewCommentBase, ReviewCommentPermissionsBase):
+class ReviewViewSet(ConditionalGetMixin, SparseFieldsMixin, NestedParentMixin,
+                    UserTitleReviewCommentBase, ReviewCommentPermissionsBase):
     queryset = Review.objects.all()
     serializer_class = ReviewSerializer
+    parents = (('title', Title),)
+    filter_backends = (FullTextSearchFilter,)
+    search_fields = ('text',)
+    required_columns = ('author', 'pub_date')
+
+    def get_version_names(self):
+        if self.action != 'list':
+            return None
+        return (f'reviews:{self.kwargs.get("title_id")}',
+                User._meta.label_lower)
+
+    def get_parent_annotations(self):
+        if self.action != 'list':
+            return {}
+        return children_state('reviews', Q(reviews__is_hidden=False))
 
-    def __get_title(self):
-        title_id = self.kwargs.get('title_id')
-        return get_object_or_404(Title, id=title_id)
+    def get_validator(self):
+        parent = self.get_parent()
+        return parent.children, parent.last_pub_date, parent.last_id
 
     def get_queryset(self):
-        return self.__get_title().reviews.all()
+        return self.get_parent().reviews.filter(
+            is_hidden=False).select_related('author')
 
     def perform_create(self, serializer):
-        serializer.save(author=self.request.user, title=self.__get_title())
+        serializer.save(author=self.request.user, title=self.get_parent())
 
 
-class CommentViewSet(UserTitleReviewCommentBase, ReviewCommentPermissionsBase):
+class CommentViewSet(ConditionalGetMixin, SparseFieldsMixin, NestedParentMixin,
+                     UserTitleReviewCommentBase, ReviewCommentPermissionsBase):
     serializer_class = CommentSerializer
+    parents = (
+        ('title', Title),
+        ('review', Review.objects.filter(is_hidden=False)),
+    )
+    required_columns = ('author', 'pub_date')
+
+    def get_version_names(self):
+        if self.action != 'list':
+            return None
+        return (f'comments:{self.kwargs.get("review_id")}',
+                User._meta.label_lower)
+
+    def get_parent_annotations(self):
+        if self.action != 'list':
+            return {}
+        return children_state('comments', Q(comments__is_hidden=False))
 
-    def __get_review(self, get_data):
-        return get_object_or_404(Review, pk=get_data.get('review_id'),
-                                 title_id=get_data.get('title_id'))
+    def get_validator(self):
+        parent = self.get_parent()
+        return parent.children, parent.last_pub_date, parent.last_id
 
     def get_queryset(self):
-        return self.__get_review(get_data=self.kwargs).comments.all()
+        return self.get_parent().comments.filter(
+            is_hidden=False).select_related('author')
 
     def perform_create(self, serializer):
-        serializer.save(
-            author=self.request.user,
-            review=self.__get_review(get_data=self.kwargs))
+        serializer.save(author=self.request.user, review=self.get_parent())
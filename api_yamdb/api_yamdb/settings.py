@@ -30,6 +30,7 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
+    'api.metrics.RequestMetricsMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
@@ -68,6 +69,32 @@ DATABASES = {
     }
 }
 
+# Cache
+# The local-memory cache is per process. With several gunicorn workers,
+# point the default cache at a shared backend (Redis, Memcached) so list
+# cache invalidation reaches every worker.
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    }
+}
+
+API_CACHE_TIMEOUT = 300
+
+# Lifetime of the version tokens behind ETags and cached lists. It bounds
+# staleness after writes that bypass signals.
+
+API_VERSION_TIMEOUT = 600
+
+# Maximum number of titles accepted by POST/PATCH /api/v1/titles/bulk/.
+
+TITLES_BULK_LIMIT = 1000
+
+# Maximum number of ids accepted by POST /api/v1/moderation/<reviews|comments>/.
+
+MODERATION_IDS_LIMIT = 10000
+
 # Password validation
 
 AUTH_PASSWORD_VALIDATORS = [
@@ -90,7 +117,16 @@ REST_FRAMEWORK = {
         "rest_framework.permissions.AllowAny",
     ],
     "DEFAULT_AUTHENTICATION_CLASSES": [
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        "users.authentication.ClaimsJWTAuthentication",
+    ],
+    "DEFAULT_RENDERER_CLASSES": [
+        "api.v1.renderers.FastJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ],
+    "DEFAULT_PARSER_CLASSES": [
+        "api.v1.parsers.FastJSONParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
     ],
     "DEFAULT_FILTER_BACKENDS": [
         "django_filters.rest_framework.DjangoFilterBackend"
@@ -99,11 +135,49 @@ REST_FRAMEWORK = {
     "PAGE_SIZE": 5,
 }
 
+# Sliding-window limits for the unauthenticated auth endpoints, per client
+# IP and per requested username, as "<count>/<second|minute|hour|day>";
+# None disables a limit. Counters are kept in the default cache, so use a
+# shared backend when several processes serve the API. The client IP is
+# REMOTE_ADDR; behind N trusted reverse proxies set
+# REST_FRAMEWORK['NUM_PROXIES'] = N to read it from X-Forwarded-For.
+
+AUTH_THROTTLE_RATES = {
+    'signup_ip': '20/hour',
+    'signup_username': '5/hour',
+    'token_ip': '30/hour',
+    'token_username': '10/hour',
+}
+
+# Request metrics: query count, SQL/serializer/render time and response size
+# per DRF route. BUDGETS maps a route name to limits, e.g.
+# {'titles-list': {'queries': 5, 'sql_ms': 50}}; with STRICT an exceeded
+# budget raises instead of logging a warning.
+
+REQUEST_METRICS = {
+    'ENABLED': False,
+    'WINDOW': 1000,
+    'BUDGETS': {},
+    'STRICT': False,
+}
+
 SIMPLE_JWT = {
     "ACCESS_TOKEN_LIFETIME": timedelta(days=1),
     "AUTH_HEADER_TYPES": ("Bearer",),
 }
 
+# Seconds a user's role and active flag are trusted before being re-read,
+# i.e. the longest delay before a demotion or deactivation takes effect
+# in another process.
+AUTH_STATE_TTL = 60
+
+# In-process LRU cache of User objects keyed by id and username.
+
+USER_CACHE = {
+    'MAX_SIZE': 1024,
+    'TTL': 300,
+}
+
 # Internationalization
 
 LANGUAGE_CODE = 'ru-RU'
@@ -130,6 +204,23 @@ DEFAULT_FROM_EMAIL = 'admin@yamdb.com'
 
 EMAIL_FILE_PATH = BASE_DIR / 'sent_emails'
 
+# Outgoing mail queue drained by `manage.py send_outbox`. Failed messages
+# are retried after RETRY_DELAY * 2 ** (attempt - 1) seconds.
+
+OUTBOX = {
+    'BATCH_SIZE': 100,
+    'MAX_ATTEMPTS': 5,
+    'RETRY_DELAY': 30,
+    'MAX_RETRY_DELAY': 3600,
+}
+
+# Accounts with reviews or comments are deactivated on DELETE and removed by
+# `manage.py remove_users`, at most BATCH_SIZE rows per transaction.
+
+USER_REMOVAL = {
+    'BATCH_SIZE': 500,
+}
+
 OUTPUT_LENGTH = 30
 
 LIMIT_EMAIL = 254
@@ -0,0 +1,7 @@
+def raw_delete(queryset):
+    # QuerySet.delete() загружает строки ради сигналов и каскадов на уровне
+    # Python. Вызывающий код сам удаляет зависимые строки, пересчитывает
+    # рейтинги и сбрасывает версии, поэтому хватает одного DELETE.
+    # _raw_delete — внутренний API Django, которым пользуется Collector для
+    # быстрых удалений; при обновлении Django проверьте его сигнатуру.
+    return queryset._raw_delete(queryset.db)
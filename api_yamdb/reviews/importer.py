@@ -0,0 +1,235 @@
+import csv
+import io
+import os
+import re
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from contextlib import contextmanager
+
+import django
+from django.contrib.auth import get_user_model
+from django.core.management.color import no_style
+from django.db import connection, transaction
+
+from api.v1.search import fts_table
+from reviews.models import Category, Comment, Genre, GenreTitle, Review, Title
+
+User = get_user_model()
+
+UNIQUE_INDEX = re.compile(r'\s*CREATE\s+UNIQUE\s', re.IGNORECASE)
+
+csv.field_size_limit(min(sys.maxsize, 2 ** 31 - 1))
+
+
+class CsvTable:
+
+    def __init__(self, filename, model, columns=None, sharded=False):
+        self.filename = filename
+        self.model = model
+        self.columns = columns or {}
+        self.sharded = sharded
+        self.fields = model._meta.local_concrete_fields
+        self.sql = 'INSERT INTO {} ({}) VALUES ({})'.format(
+            connection.ops.quote_name(model._meta.db_table),
+            ', '.join(connection.ops.quote_name(field.column)
+                      for field in self.fields),
+            ', '.join(['%s'] * len(self.fields)),
+        )
+        self.nullable = {
+            field.attname for field in self.fields if field.null
+        }
+
+    def prepare(self, row):
+        values = {}
+        for column, value in row.items():
+            name = self.columns.get(column, column)
+            if value == '' and name in self.nullable:
+                value = None
+            values[name] = value
+        obj = self.model(**values)
+        return tuple(
+            field.get_db_prep_save(getattr(obj, field.attname), connection)
+            for field in self.fields
+        )
+
+    def insert(self, rows):
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.executemany(self.sql, rows)
+
+    def reset_sequence(self):
+        statements = connection.ops.sequence_reset_sql(
+            no_style(), [self.model])
+        if statements:
+            with connection.cursor() as cursor:
+                for sql in statements:
+                    cursor.execute(sql)
+
+
+def get_tables():
+    return (
+        CsvTable('users.csv', User),
+        CsvTable('category.csv', Category),
+        CsvTable('genre.csv', Genre),
+        CsvTable('titles.csv', Title, {'category': 'category_id'}),
+        CsvTable('genre_title.csv', GenreTitle),
+        CsvTable('review.csv', Review, {'author': 'author_id'},
+                 sharded=True),
+        CsvTable('comments.csv', Comment, {'author': 'author_id'},
+                 sharded=True),
+    )
+
+
+def get_table(filename):
+    for table in get_tables():
+        if table.filename == filename:
+            return table
+    raise LookupError(filename)
+
+
+def read_batches(path, table, batch_size):
+    with open(path, encoding='utf-8', newline='') as csv_file:
+        batch = []
+        for row in csv.DictReader(csv_file):
+            batch.append(table.prepare(row))
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+
+def import_table(path, table, batch_size):
+    start = time.perf_counter()
+    total = 0
+    for batch in read_batches(path, table, batch_size):
+        table.insert(batch)
+        total += len(batch)
+    table.reset_sequence()
+    return total, time.perf_counter() - start
+
+
+def _record_end(csv_file, position, size, quotes=0):
+    csv_file.seek(position)
+    while position < size:
+        block = csv_file.read(1 << 16)
+        start = 0
+        while True:
+            newline = block.find(b'\n', start)
+            if newline == -1:
+                quotes += block.count(b'"', start)
+                break
+            quotes += block.count(b'"', start, newline)
+            if quotes % 2 == 0:
+                return position + newline + 1
+            start = newline + 1
+        position += len(block)
+    return size
+
+
+def find_shards(path, shard_size):
+    # Граница шарда - перевод строки после чётного числа кавычек, поэтому
+    # многострочные тексты отзывов в кавычках не разрываются.
+    with open(path, 'rb') as csv_file:
+        size = os.fstat(csv_file.fileno()).st_size
+        header_end = _record_end(csv_file, 0, size)
+        shards = []
+        start = header_end
+        while start < size:
+            end = size
+            if start + shard_size < size:
+                csv_file.seek(start)
+                quotes = csv_file.read(shard_size).count(b'"')
+                end = _record_end(
+                    csv_file, start + shard_size, size, quotes)
+            shards.append((start, end))
+            start = end
+    return header_end, shards
+
+
+def parse_shard(filename, path, header_end, start, end):
+    table = get_table(filename)
+    with open(path, 'rb') as csv_file:
+        header = next(csv.reader(io.StringIO(
+            csv_file.read(header_end).decode('utf-8'))))
+        csv_file.seek(start)
+        text = csv_file.read(end - start).decode('utf-8')
+    return [
+        table.prepare(dict(zip(header, row)))
+        for row in csv.reader(io.StringIO(text, newline=''))
+    ]
+
+
+def import_table_sharded(path, table, batch_size, workers, shard_size):
+    start = time.perf_counter()
+    header_end, shards = find_shards(path, shard_size)
+    total = 0
+    pending = set()
+    shards = iter(shards)
+    with ProcessPoolExecutor(workers, initializer=django.setup) as pool:
+        while True:
+            for shard_start, shard_end in shards:
+                pending.add(pool.submit(
+                    parse_shard, table.filename, str(path), header_end,
+                    shard_start, shard_end))
+                if len(pending) >= workers * 2:
+                    break
+            if not pending:
+                break
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                rows = future.result()
+                for offset in range(0, len(rows), batch_size):
+                    table.insert(rows[offset:offset + batch_size])
+                total += len(rows)
+    table.reset_sequence()
+    return total, time.perf_counter() - start
+
+
+def get_deferrable_ddl(model):
+    table = model._meta.db_table
+    with connection.cursor() as cursor:
+        if connection.vendor == 'sqlite':
+            cursor.execute(
+                "SELECT type, name, sql FROM sqlite_master "
+                "WHERE tbl_name = %s AND type IN ('index', 'trigger') "
+                "AND sql IS NOT NULL ORDER BY type", [table])
+        elif connection.vendor == 'postgresql':
+            cursor.execute(
+                "SELECT 'index', indexname, indexdef FROM pg_indexes "
+                "WHERE schemaname = current_schema() AND tablename = %s",
+                [table])
+        else:
+            return []
+        rows = cursor.fetchall()
+    # Уникальные индексы и первичные ключи остаются: без них загрузка
+    # пропустила бы дубликаты.
+    return [
+        (kind, name, sql) for kind, name, sql in rows
+        if not UNIQUE_INDEX.match(sql)
+    ]
+
+
+@contextmanager
+def deferred_indexes(models):
+    # Индексы по внешним ключам, составные индексы моделей и триггеры
+    # полнотекстового индекса удаляются на время загрузки. Их DDL берется
+    # из базы и выполняется заново, затем FTS-таблица перестраивается.
+    dropped = []
+    try:
+        with connection.schema_editor() as editor:
+            for model in models:
+                for kind, name, sql in get_deferrable_ddl(model):
+                    editor.execute('DROP {} {}'.format(
+                        kind.upper(), editor.quote_name(name)))
+                    dropped.append((model, kind, sql))
+        yield
+    finally:
+        with connection.schema_editor() as editor:
+            for _, _, sql in sorted(dropped, key=lambda item: item[1]):
+                editor.execute(sql)
+            for model in {model for model, kind, _ in dropped
+                          if kind == 'trigger'}:
+                fts = fts_table(model._meta.db_table)
+                editor.execute(
+                    f"INSERT INTO {fts}({fts}) VALUES ('rebuild')")
@@ -0,0 +1,99 @@
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import IntegrityError
+
+from api.v1.cache import bump_version
+from reviews.importer import (deferred_indexes, get_tables, import_table,
+                              import_table_sharded)
+from reviews.ratings import recalculate_ratings
+
+
+class Command(BaseCommand):
+    help = 'Загружает данные из csv-файлов в базу данных.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--path',
+            default=settings.BASE_DIR / 'static' / 'data',
+            type=Path,
+            help='Каталог с csv-файлами.',
+        )
+        parser.add_argument(
+            '--batch-size',
+            default=1000,
+            type=int,
+            help='Количество строк, вставляемых за одну транзакцию.',
+        )
+        parser.add_argument(
+            '--only',
+            nargs='+',
+            metavar='FILENAME',
+            help='Загрузить только указанные файлы, например review.csv.',
+        )
+        parser.add_argument(
+            '--workers',
+            default=1,
+            type=int,
+            help='Количество процессов для разбора отзывов и комментариев.',
+        )
+        parser.add_argument(
+            '--shard-size',
+            default=32 * 2 ** 20,
+            type=int,
+            help='Размер шарда csv-файла в байтах при параллельном разборе.',
+        )
+        parser.add_argument(
+            '--defer-indexes',
+            action='store_true',
+            help=('Удалить неуникальные индексы и триггеры поиска отзывов '
+                  'и комментариев на время загрузки и создать их после.'),
+        )
+
+    def handle(self, *args, **options):
+        if options['batch_size'] < 1 or options['workers'] < 1:
+            raise CommandError(
+                '--batch-size и --workers должны быть больше нуля.')
+        tables = get_tables()
+        if options['only']:
+            unknown = set(options['only']) - {
+                table.filename for table in tables}
+            if unknown:
+                raise CommandError(
+                    f'Неизвестные файлы: {", ".join(sorted(unknown))}')
+            tables = [
+                table for table in tables
+                if table.filename in options['only']
+            ]
+        deferred = [table.model for table in tables if table.sharded]
+        if not options['defer_indexes']:
+            deferred = []
+        with deferred_indexes(deferred):
+            for table in tables:
+                self.import_table(table, options)
+        recalculate_ratings()
+        # Строки вставлены в обход сигналов: сбрасываем версии списков.
+        bump_version(*(
+            table.model._meta.label_lower for table in tables))
+        self.stdout.write(self.style.SUCCESS('Импорт завершён.'))
+
+    def import_table(self, table, options):
+        path = options['path'] / table.filename
+        if not path.exists():
+            self.stdout.write(f'{table.filename}: файл не найден, пропуск')
+            return
+        try:
+            if table.sharded and options['workers'] > 1:
+                rows, elapsed = import_table_sharded(
+                    path, table, options['batch_size'], options['workers'],
+                    options['shard_size'])
+            else:
+                rows, elapsed = import_table(
+                    path, table, options['batch_size'])
+        except IntegrityError as error:
+            raise CommandError(f'{table.filename}: {error}')
+        self.stdout.write(
+            f'{table.filename}: {rows} строк за {elapsed:.2f} с '
+            f'({rows / max(elapsed, 1e-9):.0f} строк/с)'
+        )
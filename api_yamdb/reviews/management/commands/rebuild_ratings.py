@@ -0,0 +1,33 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from reviews.ratings import inconsistent_ratings, recalculate_ratings
+
+
+class Command(BaseCommand):
+    help = 'Пересчитывает сохранённые рейтинги произведений по отзывам.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--check',
+            action='store_true',
+            help='Только проверить рейтинги, ничего не изменяя.',
+        )
+
+    def handle(self, *args, **options):
+        if options['check']:
+            broken = inconsistent_ratings()
+            for title in broken:
+                self.stdout.write(
+                    f'{title.pk} {title.name}: '
+                    f'{title.rating_sum}/{title.rating_count}, '
+                    f'ожидалось {title.actual_sum}/{title.actual_count}'
+                )
+            count = broken.count()
+            if count:
+                raise CommandError(
+                    f'Рассинхронизировано рейтингов: {count}')
+            self.stdout.write(self.style.SUCCESS('Рейтинги согласованы.'))
+            return
+        updated = recalculate_ratings()
+        self.stdout.write(
+            self.style.SUCCESS(f'Пересчитано рейтингов: {updated}'))
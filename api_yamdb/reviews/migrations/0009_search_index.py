@@ -0,0 +1,77 @@
+from django.db import migrations
+
+# SQL полнотекстового индекса зафиксирован в миграции: изменения
+# api.v1.search не должны менять уже примененную схему.
+
+SEARCH_FIELDS = (
+    ('Title', ('name', 'description')),
+    ('Review', ('text',)),
+)
+
+
+def sqlite_statements(table, fields):
+    fts = f'{table}_fts'
+    columns = ', '.join(fields)
+    new_values = ', '.join(f'new.{field}' for field in fields)
+    old_values = ', '.join(f'old.{field}' for field in fields)
+    return (
+        f'CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5('
+        f"{columns}, content='{table}', content_rowid='id')",
+        f"INSERT INTO {fts}({fts}) VALUES ('rebuild')",
+        f'CREATE TRIGGER IF NOT EXISTS {fts}_ai AFTER INSERT ON {table} '
+        f'BEGIN INSERT INTO {fts}(rowid, {columns}) '
+        f'VALUES (new.id, {new_values}); END',
+        f'CREATE TRIGGER IF NOT EXISTS {fts}_ad AFTER DELETE ON {table} '
+        f"BEGIN INSERT INTO {fts}({fts}, rowid, {columns}) "
+        f"VALUES ('delete', old.id, {old_values}); END",
+        f'CREATE TRIGGER IF NOT EXISTS {fts}_au AFTER UPDATE OF {columns} '
+        f'ON {table} '
+        f"BEGIN INSERT INTO {fts}({fts}, rowid, {columns}) "
+        f"VALUES ('delete', old.id, {old_values}); "
+        f'INSERT INTO {fts}(rowid, {columns}) '
+        f'VALUES (new.id, {new_values}); END',
+    )
+
+
+def postgres_index(model, fields):
+    from django.contrib.postgres.indexes import GinIndex
+    from django.contrib.postgres.search import SearchVector
+    return GinIndex(
+        SearchVector(*fields, config='simple'),
+        name=f'{model._meta.db_table}_fts_idx',
+    )
+
+
+def create_indexes(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    for model_name, fields in SEARCH_FIELDS:
+        model = apps.get_model('reviews', model_name)
+        if vendor == 'sqlite':
+            for sql in sqlite_statements(model._meta.db_table, fields):
+                schema_editor.execute(sql)
+        elif vendor == 'postgresql':
+            schema_editor.add_index(model, postgres_index(model, fields))
+
+
+def drop_indexes(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    for model_name, fields in SEARCH_FIELDS:
+        model = apps.get_model('reviews', model_name)
+        fts = f'{model._meta.db_table}_fts'
+        if vendor == 'sqlite':
+            for suffix in ('ai', 'ad', 'au'):
+                schema_editor.execute(f'DROP TRIGGER IF EXISTS {fts}_{suffix}')
+            schema_editor.execute(f'DROP TABLE IF EXISTS {fts}')
+        elif vendor == 'postgresql':
+            schema_editor.remove_index(model, postgres_index(model, fields))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reviews', '0008_review_comment_keyset_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_indexes, drop_indexes),
+    ]
@@ -0,0 +1,52 @@
+# Generated by Django 3.2 on 2026-10-18 21:33
+
+from django.db import migrations, models
+
+REVIEW_TRIGGERS = (
+    "CREATE TRIGGER IF NOT EXISTS reviews_review_fts_ai AFTER INSERT "
+    "ON reviews_review BEGIN INSERT INTO reviews_review_fts(rowid, text) "
+    "VALUES (new.id, new.text); END",
+    "CREATE TRIGGER IF NOT EXISTS reviews_review_fts_ad AFTER DELETE "
+    "ON reviews_review BEGIN INSERT INTO reviews_review_fts("
+    "reviews_review_fts, rowid, text) VALUES ('delete', old.id, old.text); "
+    "END",
+    "CREATE TRIGGER IF NOT EXISTS reviews_review_fts_au AFTER UPDATE OF text "
+    "ON reviews_review BEGIN INSERT INTO reviews_review_fts("
+    "reviews_review_fts, rowid, text) VALUES ('delete', old.id, old.text); "
+    "INSERT INTO reviews_review_fts(rowid, text) VALUES (new.id, new.text); "
+    "END",
+)
+
+
+def restore_search_index(apps, schema_editor):
+    # SQLite пересоздает таблицу при добавлении поля, и триггеры
+    # полнотекстового индекса отзывов удаляются вместе со старой таблицей.
+    if schema_editor.connection.vendor != 'sqlite':
+        return
+    for sql in REVIEW_TRIGGERS:
+        schema_editor.execute(sql)
+    schema_editor.execute(
+        "INSERT INTO reviews_review_fts(reviews_review_fts) "
+        "VALUES ('rebuild')")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reviews', '0010_title_genretitle_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(migrations.RunPython.noop, restore_search_index),
+        migrations.AddField(
+            model_name='comment',
+            name='is_hidden',
+            field=models.BooleanField(default=False, verbose_name='Скрыт модератором'),
+        ),
+        migrations.AddField(
+            model_name='review',
+            name='is_hidden',
+            field=models.BooleanField(default=False, verbose_name='Скрыт модератором'),
+        ),
+        migrations.RunPython(restore_search_index, migrations.RunPython.noop),
+    ]
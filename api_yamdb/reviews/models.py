@@ -55,14 +55,34 @@ class Title(models.Model):
                                    through_fields=('title', 'genre'),)
     category = models.ForeignKey(Category, on_delete=models.SET_NULL,
                                  related_name='categories', null=True)
+    rating_sum = models.PositiveIntegerField(
+        'Сумма оценок', default=0, editable=False
+    )
+    rating_count = models.PositiveIntegerField(
+        'Количество оценок', default=0, editable=False
+    )
 
     def __str__(self):
         return self.name
 
+    @property
+    def rating(self):
+        if not self.rating_count:
+            return None
+        return self.rating_sum / self.rating_count
+
     class Meta:
         verbose_name = 'Произведение'
         verbose_name_plural = 'Произведения'
         ordering = ('name',)
+        indexes = [
+            models.Index(name='title_name_idx', fields=['name']),
+            models.Index(name='title_year_name_idx', fields=['year', 'name']),
+            models.Index(
+                name='title_category_name_idx',
+                fields=['category', 'name'],
+            ),
+        ]
 
 
 class GenreTitle(models.Model):
@@ -81,6 +101,18 @@ class GenreTitle(models.Model):
     class Meta:
         verbose_name = 'Произведение и жанр'
         verbose_name_plural = 'Произведения и жанры'
+        constraints = [
+            models.UniqueConstraint(
+                name='unique_genre_title',
+                fields=['title', 'genre'],
+            )
+        ]
+        indexes = [
+            models.Index(
+                name='genre_title_genre_idx',
+                fields=['genre', 'title'],
+            )
+        ]
 
 
 class Review(models.Model):
@@ -97,6 +129,7 @@ class Review(models.Model):
     score = models.PositiveSmallIntegerField(
         validators=[MaxValueValidator(10), MinValueValidator(1)]
     )
+    is_hidden = models.BooleanField('Скрыт модератором', default=False)
 
     def __str__(self):
         return self.text[:settings.SLUG_MAX_LENGTH]
@@ -109,6 +142,12 @@ class Review(models.Model):
                 fields=['title', 'author'],
             )
         ]
+        indexes = [
+            models.Index(
+                name='review_title_pub_date_idx',
+                fields=['title', 'pub_date', 'id'],
+            )
+        ]
 
 
 class Comment(models.Model):
@@ -122,6 +161,7 @@ class Comment(models.Model):
     pub_date = models.DateTimeField(
         'Дата добавления', auto_now_add=True, db_index=True
     )
+    is_hidden = models.BooleanField('Скрыт модератором', default=False)
 
     def __str__(self):
         return self.text[:settings.SLUG_MAX_LENGTH]
@@ -129,5 +169,11 @@ class Comment(models.Model):
     class Meta:
         ordering = ('-pub_date',)
         default_related_name = 'comments'
+        indexes = [
+            models.Index(
+                name='comment_review_pub_date_idx',
+                fields=['review', 'pub_date', 'id'],
+            )
+        ]
         verbose_name = 'Комментарий'
         verbose_name_plural = 'Комментарии'
@@ -0,0 +1,36 @@
+from django.db.models import Count, F, OuterRef, Subquery, Sum
+from django.db.models.functions import Coalesce
+
+from reviews.models import Review, Title
+
+
+def _actual_rating():
+    reviews = Review.objects.filter(
+        title=OuterRef('pk'), is_hidden=False).order_by().values('title')
+    return {
+        'actual_sum': Coalesce(
+            Subquery(reviews.annotate(total=Sum('score')).values('total')),
+            0),
+        'actual_count': Coalesce(
+            Subquery(reviews.annotate(total=Count('id')).values('total')),
+            0),
+    }
+
+
+def recalculate_ratings(titles=None):
+    if titles is None:
+        titles = Title.objects.all()
+    actual = _actual_rating()
+    return titles.update(
+        rating_sum=actual['actual_sum'],
+        rating_count=actual['actual_count'],
+    )
+
+
+def inconsistent_ratings(titles=None):
+    if titles is None:
+        titles = Title.objects.all()
+    return titles.annotate(**_actual_rating()).exclude(
+        rating_sum=F('actual_sum'),
+        rating_count=F('actual_count'),
+    )
@@ -0,0 +1,22 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from reviews.models import Review, Title
+from reviews.ratings import recalculate_ratings
+
+
+def update_title_rating(title_id):
+    # Рейтинг пересчитывается по строкам в базе, а не по оценке из
+    # загруженного экземпляра: устаревшая копия отзыва или повторное
+    # удаление не сдвигают сумму и число оценок.
+    recalculate_ratings(Title.objects.filter(pk=title_id))
+
+
+@receiver(post_save, sender=Review)
+def update_rating_on_save(sender, instance, **kwargs):
+    update_title_rating(instance.title_id)
+
+
+@receiver(post_delete, sender=Review)
+def update_rating_on_delete(sender, instance, **kwargs):
+    update_title_rating(instance.title_id)
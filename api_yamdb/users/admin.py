@@ -1,6 +1,6 @@
 from django.contrib import admin
 
-from users.models import User
+from users.models import OutboxEmail, User, UserRemoval
 
 
 @admin.register(User)
@@ -15,3 +15,28 @@ class UserAdmin(admin.ModelAdmin):
         'role',
     )
     list_editable = ('role',)
+
+
+@admin.register(OutboxEmail)
+class OutboxEmailAdmin(admin.ModelAdmin):
+    list_display = (
+        'recipient',
+        'subject',
+        'created',
+        'attempts',
+        'next_attempt',
+        'sent',
+    )
+    list_filter = ('sent',)
+
+
+@admin.register(UserRemoval)
+class UserRemovalAdmin(admin.ModelAdmin):
+    list_display = (
+        'username',
+        'created',
+        'deleted_reviews',
+        'deleted_comments',
+        'finished',
+    )
+    list_filter = ('finished',)
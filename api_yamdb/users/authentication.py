@@ -0,0 +1,114 @@
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.utils.functional import SimpleLazyObject, empty
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import (AuthenticationFailed,
+                                                 InvalidToken)
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import AccessToken
+
+from users.cache import user_cache
+
+User = get_user_model()
+
+CLAIMS = ('username', 'role', 'is_superuser', 'is_staff')
+PERMISSION_CLAIMS = ('role', 'is_superuser', 'is_staff')
+STATE_KEY = 'auth:state:{}'
+
+
+def get_access_token(user):
+    token = AccessToken.for_user(user)
+    for claim in CLAIMS:
+        token[claim] = getattr(user, claim)
+    return token
+
+
+def get_user_state(user_id):
+    key = STATE_KEY.format(user_id)
+    state = cache.get(key)
+    if state is None:
+        state = User.objects.filter(pk=user_id).values(
+            *CLAIMS, 'is_active').first() or {'is_active': False}
+        cache.set(key, state, settings.AUTH_STATE_TTL)
+    return state
+
+
+def forget_user_state(user_id):
+    cache.delete(STATE_KEY.format(user_id))
+
+
+def load_user(user_id):
+    user = user_cache.get_by_id(user_id)
+    if user is None:
+        raise AuthenticationFailed(
+            'Пользователь не найден', code='user_not_found')
+    return user
+
+
+def claim_property(name):
+    def getter(self):
+        if self._wrapped is not empty:
+            return getattr(self._wrapped, name)
+        return self.__dict__['_claims'][name]
+    return property(getter)
+
+
+class ClaimsUser(SimpleLazyObject):
+
+    def __init__(self, user_id, claims):
+        super().__init__(lambda: load_user(user_id))
+        self.__dict__['_claims'] = {'pk': user_id, 'id': user_id, **claims}
+
+    pk = claim_property('pk')
+    id = claim_property('id')
+    username = claim_property('username')
+    role = claim_property('role')
+    is_superuser = claim_property('is_superuser')
+    is_staff = claim_property('is_staff')
+    is_active = True
+    is_authenticated = True
+    is_anonymous = False
+
+    @property
+    def is_admin(self):
+        return self.role == User.ADMIN or self.is_superuser or self.is_staff
+
+    @property
+    def is_moderator(self):
+        return self.role == User.MODERATOR
+
+    def __eq__(self, other):
+        return self.pk == getattr(other, 'pk', None)
+
+    def __hash__(self):
+        return hash(self.pk)
+
+
+class ClaimsJWTAuthentication(JWTAuthentication):
+
+    def get_user(self, validated_token):
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken('Токен не содержит идентификатор пользователя')
+
+        state = get_user_state(user_id)
+        if not state['is_active']:
+            raise AuthenticationFailed(
+                'Пользователь не найден или неактивен', code='user_inactive')
+        if not all(claim in validated_token for claim in CLAIMS):
+            # Токен выдан без claims (например, AccessToken.for_user):
+            # права берутся из состояния пользователя.
+            return ClaimsUser(
+                user_id, {claim: state[claim] for claim in CLAIMS})
+        # Пользователь строится из подписанных claims. Состояние, которое
+        # перечитывается не реже раза в AUTH_STATE_TTL, служит только для
+        # отзыва: после смены роли или флагов старый токен отклоняется.
+        if any(validated_token[claim] != state[claim]
+               for claim in PERMISSION_CLAIMS):
+            raise AuthenticationFailed(
+                'Права пользователя изменились, получите новый токен',
+                code='token_outdated')
+        return ClaimsUser(
+            user_id, {claim: validated_token[claim] for claim in CLAIMS})
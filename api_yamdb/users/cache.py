@@ -0,0 +1,103 @@
+import copy
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+
+User = get_user_model()
+
+
+def clone(user):
+    user = copy.copy(user)
+    user._state = copy.copy(user._state)
+    user._state.fields_cache = {}
+    return user
+
+
+class UserCache:
+
+    def __init__(self, max_size, ttl):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._generation = 0
+        self._lock = threading.Lock()
+        self._users = OrderedDict()
+        self._usernames = {}
+
+    def _get(self, user_id):
+        entry = self._users.get(user_id)
+        if entry is None:
+            return None
+        expires, user = entry
+        if expires < time.monotonic():
+            self._remove(user_id)
+            return None
+        self._users.move_to_end(user_id)
+        return user
+
+    def _remove(self, user_id):
+        _, user = self._users.pop(user_id)
+        self._usernames.pop(user.username, None)
+
+    def _add(self, user):
+        if user.pk in self._users:
+            self._remove(user.pk)
+        self._users[user.pk] = (time.monotonic() + self.ttl, clone(user))
+        self._usernames[user.username] = user.pk
+        while len(self._users) > self.max_size:
+            self._remove(next(iter(self._users)))
+
+    def _lookup(self, user_id, **lookup):
+        with self._lock:
+            if user_id is not None:
+                user = self._get(user_id)
+                if user is not None:
+                    self.hits += 1
+                    return clone(user)
+            self.misses += 1
+            generation = self._generation
+        user = User.objects.filter(**lookup).first()
+        if user is not None:
+            with self._lock:
+                # Пока шёл запрос, запись могли инвалидировать.
+                if generation == self._generation:
+                    self._add(user)
+        return user
+
+    def get_by_id(self, user_id):
+        return self._lookup(user_id, pk=user_id)
+
+    def get_by_username(self, username):
+        with self._lock:
+            user_id = self._usernames.get(username)
+        return self._lookup(user_id, username=username)
+
+    def invalidate(self, user_id):
+        with self._lock:
+            self._generation += 1
+            if user_id in self._users:
+                self._remove(user_id)
+
+    def clear(self):
+        with self._lock:
+            self._generation += 1
+            self._users.clear()
+            self._usernames.clear()
+            self.hits = self.misses = 0
+
+    def stats(self):
+        with self._lock:
+            return {
+                'size': len(self._users),
+                'max_size': self.max_size,
+                'hits': self.hits,
+                'misses': self.misses,
+            }
+
+
+user_cache = UserCache(
+    settings.USER_CACHE['MAX_SIZE'], settings.USER_CACHE['TTL'])
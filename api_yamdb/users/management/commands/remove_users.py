@@ -0,0 +1,43 @@
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from users.removal import remove_batch
+
+
+class Command(BaseCommand):
+    help = 'Удаляет отзывы и комментарии удаленных пользователей пакетами.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            default=settings.USER_REMOVAL['BATCH_SIZE'],
+            type=int,
+            help='Количество строк, удаляемых в одной транзакции.',
+        )
+        parser.add_argument(
+            '--loop',
+            action='store_true',
+            help='Не завершаться, а ждать новые удаления.',
+        )
+        parser.add_argument(
+            '--interval',
+            default=5,
+            type=float,
+            help='Пауза в секундах между проверками очереди в режиме --loop.',
+        )
+
+    def handle(self, *args, **options):
+        while True:
+            removal = remove_batch(options['batch_size'])
+            if removal is not None:
+                status = 'завершено' if removal.finished else 'в процессе'
+                self.stdout.write(
+                    f'{removal.username}: удалено отзывов '
+                    f'{removal.deleted_reviews}, комментариев '
+                    f'{removal.deleted_comments}, {status}')
+                continue
+            if not options['loop']:
+                break
+            time.sleep(options['interval'])
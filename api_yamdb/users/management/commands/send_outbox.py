@@ -0,0 +1,40 @@
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from users.outbox import send_batch
+
+
+class Command(BaseCommand):
+    help = 'Отправляет письма из очереди.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            default=settings.OUTBOX['BATCH_SIZE'],
+            type=int,
+            help='Количество писем, отправляемых через одно соединение.',
+        )
+        parser.add_argument(
+            '--loop',
+            action='store_true',
+            help='Не завершаться, а ждать новые письма.',
+        )
+        parser.add_argument(
+            '--interval',
+            default=5,
+            type=float,
+            help='Пауза в секундах между проверками очереди в режиме --loop.',
+        )
+
+    def handle(self, *args, **options):
+        while True:
+            sent, failed = send_batch(options['batch_size'])
+            if sent or failed:
+                self.stdout.write(
+                    f'Отправлено: {sent}, ошибок: {failed}')
+                continue
+            if not options['loop']:
+                break
+            time.sleep(options['interval'])
@@ -0,0 +1,32 @@
+# Generated by Django 3.2 on 2026-10-18 21:36
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0004_outboxemail'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UserRemoval',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('username', models.CharField(max_length=150, verbose_name='Имя пользователя')),
+                ('created', models.DateTimeField(auto_now_add=True, verbose_name='Создано')),
+                ('deleted_reviews', models.PositiveIntegerField(default=0, verbose_name='Удалено отзывов')),
+                ('deleted_comments', models.PositiveIntegerField(default=0, verbose_name='Удалено комментариев')),
+                ('finished', models.DateTimeField(blank=True, null=True, verbose_name='Завершено')),
+                ('user', models.OneToOneField(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='removal', to=settings.AUTH_USER_MODEL, verbose_name='Пользователь')),
+            ],
+            options={
+                'verbose_name': 'Удаление пользователя',
+                'verbose_name_plural': 'Удаление пользователей',
+                'ordering': ('created',),
+            },
+        ),
+    ]
@@ -1,5 +1,6 @@
 from django.contrib.auth.models import AbstractUser
 from django.db import models
+from django.utils import timezone
 
 from api.v1.validators import validator
 
@@ -61,3 +62,58 @@ class User(AbstractUser):
 
     def __str__(self):
         return self.username[: 30]
+
+
+class OutboxEmail(models.Model):
+    recipient = models.EmailField('Получатель')
+    subject = models.CharField('Тема', max_length=MAX_LENGTH)
+    body = models.TextField('Текст')
+    created = models.DateTimeField('Создано', auto_now_add=True)
+    attempts = models.PositiveSmallIntegerField('Попытки', default=0)
+    next_attempt = models.DateTimeField(
+        'Следующая попытка', default=timezone.now
+    )
+    sent = models.DateTimeField('Отправлено', null=True, blank=True)
+    last_error = models.TextField('Последняя ошибка', blank=True)
+
+    class Meta:
+        verbose_name = 'Письмо в очереди'
+        verbose_name_plural = 'Очередь писем'
+        ordering = ('next_attempt',)
+        indexes = [
+            models.Index(
+                name='outbox_pending_idx',
+                fields=['sent', 'next_attempt'],
+            )
+        ]
+
+    def __str__(self):
+        return f'{self.subject} -> {self.recipient}'
+
+
+class UserRemoval(models.Model):
+    user = models.OneToOneField(
+        User,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='removal',
+        verbose_name='Пользователь',
+    )
+    username = models.CharField('Имя пользователя', max_length=MAX_LENGTH)
+    created = models.DateTimeField('Создано', auto_now_add=True)
+    deleted_reviews = models.PositiveIntegerField(
+        'Удалено отзывов', default=0
+    )
+    deleted_comments = models.PositiveIntegerField(
+        'Удалено комментариев', default=0
+    )
+    finished = models.DateTimeField('Завершено', null=True, blank=True)
+
+    class Meta:
+        verbose_name = 'Удаление пользователя'
+        verbose_name_plural = 'Удаление пользователей'
+        ordering = ('created',)
+
+    def __str__(self):
+        return self.username
@@ -0,0 +1,71 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.mail import EmailMessage, get_connection
+from django.db import transaction
+from django.utils import timezone
+
+from users.models import OutboxEmail
+
+
+def enqueue_email(recipient, subject, body):
+    return OutboxEmail.objects.create(
+        recipient=recipient, subject=subject, body=body)
+
+
+def retry_delay(attempts):
+    return timedelta(seconds=min(
+        settings.OUTBOX['RETRY_DELAY'] * 2 ** (attempts - 1),
+        settings.OUTBOX['MAX_RETRY_DELAY'],
+    ))
+
+
+def fail(email, now, error):
+    email.attempts += 1
+    email.next_attempt = now + retry_delay(email.attempts)
+    email.last_error = str(error)
+
+
+def send_batch(batch_size):
+    now = timezone.now()
+    with transaction.atomic():
+        emails = list(OutboxEmail.objects.select_for_update(
+            skip_locked=True
+        ).filter(
+            sent__isnull=True,
+            next_attempt__lte=now,
+            attempts__lt=settings.OUTBOX['MAX_ATTEMPTS'],
+        )[:batch_size])
+        if not emails:
+            return 0, 0
+        sent = 0
+        connection = get_connection()
+        try:
+            connection.open()
+        except Exception as error:
+            for email in emails:
+                fail(email, now, error)
+        else:
+            with connection:
+                for email in emails:
+                    message = EmailMessage(
+                        email.subject, email.body,
+                        settings.DEFAULT_FROM_EMAIL, [email.recipient],
+                        connection=connection,
+                    )
+                    try:
+                        message.send()
+                    except Exception as error:
+                        fail(email, now, error)
+                    else:
+                        email.attempts += 1
+                        email.sent = now
+                        email.last_error = ''
+                        # Код подтверждения в тексте письма - это пароль
+                        # для auth/token/, после отправки он не хранится.
+                        email.body = ''
+                        sent += 1
+        OutboxEmail.objects.bulk_update(
+            emails,
+            ('attempts', 'next_attempt', 'sent', 'last_error', 'body'))
+    return sent, len(emails) - sent
@@ -0,0 +1,71 @@
+from django.db import transaction
+from django.utils import timezone
+
+from api.v1.cache import bump_version
+from reviews.deletion import raw_delete
+from reviews.models import Comment, Review, Title
+from reviews.ratings import recalculate_ratings
+from users.models import User, UserRemoval
+
+
+def remove_user(user):
+    if not (Review.objects.filter(author=user).exists()
+            or Comment.objects.filter(author=user).exists()):
+        user.delete()
+        return None
+    with transaction.atomic():
+        user.is_active = False
+        user.save(update_fields=('is_active',))
+        removal, _ = UserRemoval.objects.get_or_create(
+            user=user, defaults={'username': user.username})
+    return removal
+
+
+def delete_comments(comments, batch_size):
+    batch = list(
+        comments.order_by().values_list('pk', 'review_id')[:batch_size])
+    if batch:
+        raw_delete(Comment.objects.filter(pk__in=[pk for pk, _ in batch]))
+        bump_version(*{f'comments:{review_id}' for _, review_id in batch})
+    return len(batch)
+
+
+def remove_step(removal, batch_size):
+    deleted = delete_comments(
+        Comment.objects.filter(author_id=removal.user_id), batch_size)
+    if deleted:
+        removal.deleted_comments += deleted
+        return
+    reviews = list(Review.objects.filter(
+        author_id=removal.user_id
+    ).order_by('pk').values_list('pk', 'title_id')[:batch_size])
+    if not reviews:
+        User.objects.filter(pk=removal.user_id).delete()
+        removal.user = None
+        removal.finished = timezone.now()
+        return
+    review_ids = [pk for pk, _ in reviews]
+    # Чужие комментарии к отзывам удаляются теми же пакетами, пока
+    # у отзывов пакета они не закончатся.
+    deleted = delete_comments(
+        Comment.objects.filter(review_id__in=review_ids), batch_size)
+    if deleted:
+        removal.deleted_comments += deleted
+        return
+    raw_delete(Review.objects.filter(pk__in=review_ids))
+    title_ids = {title_id for _, title_id in reviews}
+    recalculate_ratings(Title.objects.filter(pk__in=title_ids))
+    bump_version(*(f'reviews:{pk}' for pk in title_ids))
+    removal.deleted_reviews += len(reviews)
+
+
+def remove_batch(batch_size):
+    with transaction.atomic():
+        removal = UserRemoval.objects.select_for_update(
+            skip_locked=True
+        ).filter(finished__isnull=True).first()
+        if removal is None:
+            return None
+        remove_step(removal, batch_size)
+        removal.save()
+    return removal
@@ -0,0 +1,13 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from users.authentication import forget_user_state
+from users.cache import user_cache
+from users.models import User
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def invalidate_user_state(sender, instance, **kwargs):
+    forget_user_state(instance.pk)
+    user_cache.invalidate(instance.pk)
@@ -0,0 +1,79 @@
+"""Трафик и CPU на опрос ресурсов с If-None-Match и без него.
+
+Запуск из корня репозитория: python benchmarks/conditional_get.py
+"""
+import argparse
+
+from utils import measure, print_table, setup_django, test_database
+
+
+def seed(reviews, comments):
+    from django.contrib.auth import get_user_model
+
+    from reviews.models import Category, Comment, Genre, Review, Title
+
+    User = get_user_model()
+    category = Category.objects.create(name='Фильм', slug='films')
+    genre = Genre.objects.create(name='Драма', slug='drama')
+    title = Title.objects.create(
+        name='Произведение', year=2000, category=category,
+        description='Описание ' * 50)
+    title.genre.add(genre)
+    User.objects.bulk_create(
+        User(username=f'user{idx}', email=f'user{idx}@yamdb.fake')
+        for idx in range(reviews))
+    for author in User.objects.all():
+        review = Review.objects.create(
+            title=title, author=author, text='Отзыв ' * 40, score=7)
+    Comment.objects.bulk_create(
+        Comment(review=review, author=author, text='Комментарий ' * 20)
+        for _ in range(comments))
+    return title, review
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--repeat', type=int, default=500)
+    parser.add_argument('--reviews', type=int, default=50)
+    parser.add_argument('--comments', type=int, default=50)
+    args = parser.parse_args()
+
+    setup_django()
+    from rest_framework.test import APIClient
+
+    with test_database():
+        title, review = seed(args.reviews, args.comments)
+        client = APIClient()
+        urls = {
+            'title detail': f'/api/v1/titles/{title.id}/',
+            'reviews list': f'/api/v1/titles/{title.id}/reviews/',
+            'comments list': (f'/api/v1/titles/{title.id}/reviews/'
+                              f'{review.id}/comments/'),
+        }
+        rows = []
+        for name, url in urls.items():
+            first = client.get(url)
+            etag = first['ETag']
+            plain_wall, plain_cpu = measure(
+                lambda: client.get(url), args.repeat)
+            cond_wall, cond_cpu = measure(
+                lambda: client.get(url, HTTP_IF_NONE_MATCH=etag),
+                args.repeat)
+            not_modified = client.get(url, HTTP_IF_NONE_MATCH=etag)
+            rows.append((
+                name,
+                len(first.content),
+                len(not_modified.content),
+                f'{plain_cpu * 1e3:.3f}',
+                f'{cond_cpu * 1e3:.3f}',
+                f'{plain_wall * 1e3:.3f}',
+                f'{cond_wall * 1e3:.3f}',
+            ))
+        print_table(
+            ('resource', 'bytes 200', 'bytes 304', 'cpu ms 200',
+             'cpu ms 304', 'wall ms 200', 'wall ms 304'),
+            rows)
+
+
+if __name__ == '__main__':
+    main()
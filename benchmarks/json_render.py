@@ -0,0 +1,76 @@
+"""Время рендеринга страниц /api/v1/titles/ стандартным и быстрым JSON.
+
+Сериализованные данные готовятся заранее, поэтому замер включает только
+рендерер: JSONRenderer из DRF против FastJSONRenderer (orjson, если он
+установлен).
+
+Запуск из корня репозитория: python benchmarks/json_render.py
+"""
+import argparse
+
+from utils import measure, print_table, setup_django, test_database
+
+
+def seed(count):
+    from reviews.models import Category, Genre, Title
+
+    category = Category.objects.create(name='Фильм', slug='films')
+    genres = [
+        Genre.objects.create(name=f'Жанр {idx}', slug=f'genre_{idx}')
+        for idx in range(3)
+    ]
+    Title.objects.bulk_create(
+        Title(name=f'Произведение {idx}', year=2000, category=category,
+              description='Описание ' * 20,
+              rating_sum=idx % 10 * 3, rating_count=idx % 10)
+        for idx in range(count))
+    for title in Title.objects.all():
+        title.genre.set(genres)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--repeat', type=int, default=200)
+    parser.add_argument('--sizes', type=int, nargs='+',
+                        default=(5, 100, 1000))
+    args = parser.parse_args()
+
+    setup_django()
+    from rest_framework.renderers import JSONRenderer
+
+    from api.v1.renderers import FastJSONRenderer, orjson
+    from api.v1.serializers import TitleSerializer
+    from api.v1.views import TitleViewSet
+
+    with test_database():
+        seed(max(args.sizes))
+        rows = []
+        for size in args.sizes:
+            data = {
+                'count': size,
+                'next': None,
+                'previous': None,
+                'results': TitleSerializer(
+                    TitleViewSet.queryset.all()[:size], many=True).data,
+            }
+            stdlib = JSONRenderer().render(data)
+            fast = FastJSONRenderer().render(data)
+            assert stdlib == fast
+            std_wall, _ = measure(
+                lambda: JSONRenderer().render(data), args.repeat)
+            fast_wall, _ = measure(
+                lambda: FastJSONRenderer().render(data), args.repeat)
+            rows.append((
+                size,
+                len(fast),
+                f'{std_wall * 1e3:.3f}',
+                f'{fast_wall * 1e3:.3f}',
+                f'{std_wall / fast_wall:.1f}x',
+            ))
+    print(f'orjson: {orjson.__version__ if orjson else "не установлен"}')
+    print_table(
+        ('titles', 'bytes', 'json ms', 'fast ms', 'speedup'), rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,88 @@
+"""Время сериализации 1000 произведений, отзывов и комментариев.
+
+Сравнивается обычный ListSerializer из DRF и FastListSerializer с заранее
+собранным планом полей; объекты загружаются из базы один раз, поэтому в
+замер попадает только сериализация.
+
+Запуск из корня репозитория: python benchmarks/list_serializers.py
+"""
+import argparse
+
+from utils import measure, print_table, setup_django, test_database
+
+
+def seed(count):
+    from django.contrib.auth import get_user_model
+
+    from reviews.models import Category, Comment, Genre, Review, Title
+
+    User = get_user_model()
+    category = Category.objects.create(name='Фильм', slug='films')
+    genres = [
+        Genre.objects.create(name=f'Жанр {idx}', slug=f'genre_{idx}')
+        for idx in range(3)
+    ]
+    Title.objects.bulk_create(
+        Title(name=f'Произведение {idx}', year=2000, category=category,
+              description='Описание ' * 20)
+        for idx in range(count))
+    for title in Title.objects.all():
+        title.genre.set(genres)
+    User.objects.bulk_create(
+        User(username=f'user{idx}', email=f'user{idx}@yamdb.fake')
+        for idx in range(count))
+    title = Title.objects.first()
+    Review.objects.bulk_create(
+        Review(title=title, author=author, text='Отзыв ' * 40, score=7)
+        for author in User.objects.all())
+    review = Review.objects.first()
+    Comment.objects.bulk_create(
+        Comment(review=review, author=review.author,
+                text='Комментарий ' * 20)
+        for _ in range(count))
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--repeat', type=int, default=20)
+    parser.add_argument('--count', type=int, default=1000)
+    args = parser.parse_args()
+
+    setup_django()
+    from rest_framework.serializers import ListSerializer
+
+    from api.v1.serializers import (CommentSerializer, ReviewSerializer,
+                                    TitleSerializer)
+    from api.v1.views import TitleViewSet
+    from reviews.models import Comment, Review
+
+    with test_database():
+        seed(args.count)
+        querysets = {
+            TitleSerializer: TitleViewSet.queryset.all(),
+            ReviewSerializer: Review.objects.select_related('author'),
+            CommentSerializer: Comment.objects.select_related('author'),
+        }
+        rows = []
+        for serializer_class, queryset in querysets.items():
+            objects = list(queryset)
+            plain_wall, _ = measure(
+                lambda: ListSerializer(
+                    child=serializer_class(), instance=objects).data,
+                args.repeat)
+            fast_wall, _ = measure(
+                lambda: serializer_class(objects, many=True).data,
+                args.repeat)
+            rows.append((
+                serializer_class.__name__,
+                len(objects),
+                f'{plain_wall * 1e3:.2f}',
+                f'{fast_wall * 1e3:.2f}',
+                f'{plain_wall / fast_wall:.1f}x',
+            ))
+    print_table(
+        ('serializer', 'objects', 'drf ms', 'fast ms', 'speedup'), rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,102 @@
+"""Удаление волны спама: поштучные DELETE против /api/v1/moderation/.
+
+Создает спам-отзывы и комментарии одного автора, затем удаляет часть
+комментариев запросами DELETE по одному, а остальное — одним запросом
+массовой модерации. Печатает время и число SQL-запросов на объект.
+
+Запуск из корня репозитория: python benchmarks/moderation.py
+"""
+import argparse
+import logging
+import time
+
+from utils import print_table, setup_django, test_database
+
+
+def timed(func):
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+
+    start = time.perf_counter()
+    with CaptureQueriesContext(connection) as context:
+        func()
+    return time.perf_counter() - start, len(context)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--titles', type=int, default=200)
+    parser.add_argument('--comments', type=int, default=50,
+                        help='комментариев на отзыв')
+    parser.add_argument('--single', type=int, default=200,
+                        help='комментариев, удаляемых по одному')
+    args = parser.parse_args()
+
+    setup_django()
+    from django.conf import settings
+    from django.contrib.auth import get_user_model
+    from django.test.utils import override_settings
+    from rest_framework.test import APIClient
+    from rest_framework_simplejwt.tokens import AccessToken
+
+    from reviews.models import Comment, Review, Title
+
+    User = get_user_model()
+    logging.getLogger('django.request').setLevel(logging.ERROR)
+    with test_database(), override_settings(
+            DEBUG=True, REQUEST_METRICS=dict(
+                settings.REQUEST_METRICS, ENABLED=False)):
+        spammer = User.objects.create(
+            username='spammer', email='spammer@yamdb.fake')
+        moderator = User.objects.create(
+            username='moderator', email='moderator@yamdb.fake',
+            role=User.MODERATOR)
+        Title.objects.bulk_create(
+            Title(name=f'Произведение {idx}', year=2000)
+            for idx in range(args.titles))
+        for title in Title.objects.all():
+            Review.objects.create(
+                title=title, author=spammer, text='Спам', score=1)
+        Comment.objects.bulk_create(
+            Comment(review=review, author=spammer, text='Спам')
+            for review in Review.objects.all()
+            for _ in range(args.comments))
+        client = APIClient()
+        client.credentials(
+            HTTP_AUTHORIZATION=f'Bearer {AccessToken.for_user(moderator)}')
+
+        single = Comment.objects.select_related('review')[:args.single]
+        urls = [
+            f'/api/v1/titles/{comment.review.title_id}/reviews/'
+            f'{comment.review_id}/comments/{comment.id}/'
+            for comment in single
+        ]
+        rows = []
+        elapsed, queries = timed(lambda: [client.delete(url) for url in urls])
+        rows.append(('DELETE', len(urls), f'{elapsed:.2f}',
+                     f'{len(urls) / elapsed:.0f}',
+                     f'{queries / len(urls):.2f}'))
+
+        comments = Comment.objects.count()
+        reviews = Review.objects.count()
+        response = None
+
+        def purge():
+            nonlocal response
+            response = client.post(
+                '/api/v1/moderation/reviews/',
+                data={'action': 'delete', 'author': spammer.username},
+                format='json')
+
+        elapsed, queries = timed(purge)
+        assert response.json() == {
+            'reviews': reviews, 'comments': comments, 'titles': args.titles}
+        total = comments + reviews
+        rows.append(('moderation', total, f'{elapsed:.2f}',
+                     f'{total / elapsed:.0f}', f'{queries / total:.4f}'))
+    print_table(('method', 'objects', 'seconds', 'objects/s',
+                 'queries/object'), rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,83 @@
+"""Пропускная способность создания отзывов через /api/v1/titles/<id>/reviews/.
+
+Каждый пользователь пишет по отзыву на каждое произведение, затем повторяет
+запросы, чтобы замерить отказы по ограничению unique_review. Печатает
+запросы в секунду и число SQL-запросов на один POST.
+
+Запуск из корня репозитория: python benchmarks/review_writes.py
+"""
+import argparse
+import logging
+import time
+
+from utils import print_table, setup_django, test_database
+
+
+def run(clients, titles):
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+
+    statuses = {}
+    start = time.perf_counter()
+    with CaptureQueriesContext(connection) as context:
+        for client in clients:
+            for title in titles:
+                status = client.post(
+                    f'/api/v1/titles/{title.id}/reviews/',
+                    data={'text': 'Отзыв', 'score': 7},
+                ).status_code
+                statuses[status] = statuses.get(status, 0) + 1
+    elapsed = time.perf_counter() - start
+    requests = len(clients) * len(titles)
+    return statuses, requests / elapsed, len(context) / requests
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--users', type=int, default=20)
+    parser.add_argument('--titles', type=int, default=50)
+    args = parser.parse_args()
+
+    setup_django()
+    from django.conf import settings
+    from django.contrib.auth import get_user_model
+    from django.test.utils import override_settings
+    from rest_framework.test import APIClient
+    from rest_framework_simplejwt.tokens import AccessToken
+
+    from reviews.models import Title
+
+    User = get_user_model()
+    logging.getLogger('django.request').setLevel(logging.ERROR)
+    rows = []
+    with test_database(), override_settings(
+            DEBUG=True, REQUEST_METRICS=dict(
+                settings.REQUEST_METRICS, ENABLED=False)):
+        User.objects.bulk_create(
+            User(username=f'user{idx}', email=f'user{idx}@yamdb.fake')
+            for idx in range(args.users))
+        Title.objects.bulk_create(
+            Title(name=f'Произведение {idx}', year=2000)
+            for idx in range(args.titles))
+        titles = list(Title.objects.all())
+        clients = []
+        for user in User.objects.all():
+            client = APIClient()
+            client.credentials(
+                HTTP_AUTHORIZATION=f'Bearer {AccessToken.for_user(user)}')
+            clients.append(client)
+        for name in ('create', 'duplicate'):
+            statuses, throughput, queries = run(clients, titles)
+            rows.append((
+                name,
+                ', '.join(f'{status}: {count}'
+                          for status, count in sorted(statuses.items())),
+                f'{throughput:.0f}',
+                f'{queries:.1f}',
+            ))
+    print_table(('phase', 'statuses', 'requests/s', 'queries/request'),
+                rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,84 @@
+"""Задержка /api/v1/auth/signup/ при разной скорости почтового сервера.
+
+Письма кладутся в очередь, поэтому p99 регистрации не должен зависеть от
+задержки почтового бэкенда; для сравнения приведено время прямой отправки
+письма и время разбора очереди командой send_outbox.
+
+Запуск из корня репозитория: python benchmarks/signup_latency.py
+"""
+import argparse
+import time
+
+from utils import print_table, setup_django, test_database
+
+
+def percentile(values, percent):
+    ordered = sorted(values)
+    return ordered[max(0, -(-len(ordered) * percent // 100) - 1)]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--requests', type=int, default=200)
+    parser.add_argument('--latencies', type=int, nargs='+',
+                        default=(0, 50, 200))
+    args = parser.parse_args()
+
+    setup_django()
+    from django.conf import settings
+    from django.core import mail
+    from django.core.cache import cache
+    from django.core.mail.backends.locmem import EmailBackend
+    from django.test.utils import override_settings
+    from rest_framework.test import APIClient
+
+    from users.outbox import send_batch
+
+    class SlowBackend(EmailBackend):
+        latency = 0
+
+        def send_messages(self, messages):
+            time.sleep(self.latency / 1000 * len(messages))
+            return super().send_messages(messages)
+
+    globals()['SlowBackend'] = SlowBackend
+    rows = []
+    with test_database(), override_settings(
+            EMAIL_BACKEND=f'{__name__}.SlowBackend',
+            AUTH_THROTTLE_RATES=dict.fromkeys(settings.AUTH_THROTTLE_RATES)):
+        client = APIClient()
+        for latency in args.latencies:
+            SlowBackend.latency = latency
+            cache.clear()
+            timings = []
+            for idx in range(args.requests):
+                start = time.perf_counter()
+                client.post('/api/v1/auth/signup/', data={
+                    'username': f'user_{latency}_{idx}',
+                    'email': f'user_{latency}_{idx}@yamdb.fake',
+                })
+                timings.append((time.perf_counter() - start) * 1000)
+
+            start = time.perf_counter()
+            mail.EmailMessage('x', 'y', to=['a@yamdb.fake']).send()
+            inline = (time.perf_counter() - start) * 1000
+
+            start = time.perf_counter()
+            while any(send_batch(100)):
+                pass
+            drain = time.perf_counter() - start
+            rows.append((
+                latency,
+                f'{percentile(timings, 50):.2f}',
+                f'{percentile(timings, 99):.2f}',
+                f'{inline:.2f}',
+                f'{args.requests / drain:.0f}',
+            ))
+    print_table(
+        ('backend ms', 'signup p50 ms', 'signup p99 ms',
+         'inline send ms', 'outbox mails/s'),
+        rows)
+
+
+if __name__ == '__main__':
+    main()
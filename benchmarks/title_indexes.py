@@ -0,0 +1,156 @@
+"""Планы запросов и задержка фильтров произведений, отзывов и комментариев.
+
+Заполняет тестовую базу произведениями (по умолчанию 1M) и отзывами
+(по 10 на произведение), затем для каждой комбинации фильтров TitleFilter
+и для списков отзывов/комментариев печатает EXPLAIN первой страницы и
+задержку запроса страницы вместе с COUNT(*). С --without-indexes индексы
+моделей удаляются на время замеров, чтобы сравнить планы.
+
+Запуск из корня репозитория: python benchmarks/title_indexes.py
+"""
+import argparse
+from contextlib import contextmanager, nullcontext
+from datetime import timedelta
+from itertools import islice
+
+from utils import measure, print_table, setup_django, test_database
+
+PAGE_SIZE = 5
+
+
+def insert(table, columns, rows, batch_size=10000):
+    from django.db import connection, transaction
+
+    sql = (f'INSERT INTO {table} ({", ".join(columns)}) '
+           f'VALUES ({", ".join(["%s"] * len(columns))})')
+    rows = iter(rows)
+    with transaction.atomic(), connection.cursor() as cursor:
+        while True:
+            batch = list(islice(rows, batch_size))
+            if not batch:
+                break
+            cursor.executemany(sql, batch)
+
+
+@contextmanager
+def without_model_indexes(models):
+    from django.db import connection
+
+    # Удаляются только индексы из Meta.indexes: индексы внешних ключей
+    # остаются, чтобы сравнение показывало вклад составных индексов.
+    with connection.schema_editor() as editor:
+        for model in models:
+            for index in model._meta.indexes:
+                editor.remove_index(model, index)
+    try:
+        yield
+    finally:
+        with connection.schema_editor() as editor:
+            for model in models:
+                for index in model._meta.indexes:
+                    editor.add_index(model, index)
+
+
+def seed(titles, reviews_per_title, comments):
+    from django.contrib.auth import get_user_model
+    from django.utils import timezone
+
+    from reviews.models import (Category, Comment, Genre, GenreTitle, Review,
+                                Title)
+
+    User = get_user_model()
+    Category.objects.bulk_create(
+        Category(name=f'Категория {idx}', slug=f'category_{idx}')
+        for idx in range(10))
+    Genre.objects.bulk_create(
+        Genre(name=f'Жанр {idx}', slug=f'genre_{idx}') for idx in range(20))
+    User.objects.bulk_create(
+        User(username=f'user{idx}', email=f'user{idx}@yamdb.fake')
+        for idx in range(reviews_per_title))
+    categories = list(Category.objects.values_list('id', flat=True))
+    genres = list(Genre.objects.values_list('id', flat=True))
+    users = list(User.objects.values_list('id', flat=True))
+    insert(Title._meta.db_table,
+           ('name', 'year', 'description', 'category_id', 'rating_sum',
+            'rating_count'),
+           ((f'Произведение {idx:07d}', 1900 + idx % 120, 'Описание',
+             categories[idx % len(categories)], 0, 0)
+            for idx in range(titles)))
+    first = Title.objects.order_by('id').values_list('id', flat=True)[0]
+    insert(GenreTitle._meta.db_table, ('title_id', 'genre_id'),
+           ((first + idx, genres[(idx + shift) % len(genres)])
+            for idx in range(titles) for shift in (0, 7)))
+    now = timezone.now()
+    insert(Review._meta.db_table,
+           ('title_id', 'author_id', 'text', 'score', 'pub_date',
+            'is_hidden'),
+           ((first + idx, author, 'Отзыв', 1 + idx % 10,
+             now - timedelta(seconds=idx * len(users) + number), False)
+            for idx in range(titles)
+            for number, author in enumerate(users)))
+    review = Review.objects.filter(title_id=first).order_by('id')[0]
+    insert(Comment._meta.db_table,
+           ('review_id', 'author_id', 'text', 'pub_date', 'is_hidden'),
+           ((review.id, review.author_id, 'Комментарий',
+             now - timedelta(seconds=idx), False)
+            for idx in range(comments)))
+    return first, review.id
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--titles', type=int, default=1_000_000)
+    parser.add_argument('--reviews-per-title', type=int, default=10)
+    parser.add_argument('--comments', type=int, default=1000)
+    parser.add_argument('--repeat', type=int, default=20)
+    parser.add_argument('--without-indexes', action='store_true')
+    args = parser.parse_args()
+
+    setup_django()
+    from api.v1.filters import TitleFilter
+    from api.v1.views import TitleViewSet
+    from reviews.models import Comment, GenreTitle, Review, Title
+
+    with test_database():
+        title_id, review_id = seed(
+            args.titles, args.reviews_per_title, args.comments)
+        querysets = {
+            f'titles {params or "{}"}': TitleFilter(
+                params, queryset=TitleViewSet.queryset).qs
+            for params in (
+                {},
+                {'name': 'Произведение 0000500'},
+                {'year': 1950},
+                {'genre': 'genre_3'},
+                {'category': 'category_4'},
+                {'category__in': 'category_4,category_5'},
+                {'category__startswith': 'category_4'},
+                {'category__icontains': 'category_4'},
+                {'genre__in': 'genre_3,genre_4'},
+                {'year': 1950, 'genre': 'genre_3'},
+                {'year': 1950, 'category': 'category_4'},
+                {'genre': 'genre_3', 'category': 'category_4'},
+            )
+        }
+        querysets['reviews of title'] = Review.objects.filter(
+            title_id=title_id).order_by('-pub_date', '-id')
+        querysets['comments of review'] = Comment.objects.filter(
+            review_id=review_id).order_by('-pub_date', '-id')
+
+        indexes = (
+            without_model_indexes((Title, GenreTitle, Review, Comment))
+            if args.without_indexes else nullcontext())
+        rows = []
+        with indexes:
+            for name, queryset in querysets.items():
+                page = queryset[:PAGE_SIZE]
+                print(f'== {name}')
+                print(page.explain())
+                wall, _ = measure(
+                    lambda: (queryset.count(), list(page.all())), args.repeat)
+                rows.append((name, f'{wall * 1e3:.3f}'))
+    print_table(('query', 'page + count ms'), rows)
+
+
+if __name__ == '__main__':
+    main()
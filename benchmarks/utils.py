@@ -0,0 +1,48 @@
+import os
+import sys
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+PROJECT_DIR = Path(__file__).resolve().parent.parent / 'api_yamdb'
+
+
+def setup_django():
+    sys.path.insert(0, str(PROJECT_DIR))
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'api_yamdb.settings')
+    import django
+    django.setup()
+
+
+@contextmanager
+def test_database():
+    from django.db import connection
+    from django.test.utils import (setup_test_environment,
+                                   teardown_test_environment)
+    setup_test_environment()
+    old_name = connection.creation.create_test_db(
+        verbosity=0, autoclobber=True)
+    try:
+        yield
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+        teardown_test_environment()
+
+
+def measure(func, repeat):
+    wall = time.perf_counter()
+    cpu = time.process_time()
+    for _ in range(repeat):
+        func()
+    return ((time.perf_counter() - wall) / repeat,
+            (time.process_time() - cpu) / repeat)
+
+
+def print_table(header, rows):
+    widths = [
+        max(len(str(value)) for value in column)
+        for column in zip(header, *rows)
+    ]
+    for row in (header, *rows):
+        print('  '.join(str(value).rjust(width)
+                        for value, width in zip(row, widths)))
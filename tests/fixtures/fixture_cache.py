@@ -0,0 +1,13 @@
+import pytest
+from django.core.cache import cache
+
+from users.cache import user_cache
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+    user_cache.clear()
+    yield
+    cache.clear()
+    user_cache.clear()
@@ -0,0 +1,95 @@
+from http import HTTPStatus
+
+import pytest
+from django.core.management import CommandError, call_command
+
+from reviews.models import Review, Title
+from reviews.ratings import inconsistent_ratings
+from tests.utils import create_reviews, create_single_review
+
+
+@pytest.mark.django_db(transaction=True)
+class Test08TitleRating:
+
+    TITLE_URL_TEMPLATE = '/api/v1/titles/{title_id}/'
+    REVIEW_URL_TEMPLATE = '/api/v1/titles/{title_id}/reviews/{review_id}/'
+
+    def get_rating(self, client, title_id):
+        response = client.get(self.TITLE_URL_TEMPLATE.format(
+            title_id=title_id))
+        assert response.status_code == HTTPStatus.OK
+        return response.json()['rating']
+
+    def test_01_rating_follows_reviews(self, admin_client, admin,
+                                       user_client, user):
+        reviews, titles = create_reviews(
+            admin_client, {admin: admin_client}
+        )
+        title_id = titles[0]['id']
+        create_single_review(user_client, title_id, 'Так себе', 1)
+        assert self.get_rating(admin_client, title_id) == 3, (
+            'Проверьте, что рейтинг произведения обновляется при создании '
+            'отзыва.'
+        )
+
+        response = admin_client.patch(
+            self.REVIEW_URL_TEMPLATE.format(
+                title_id=title_id, review_id=reviews[0]['id']),
+            data={'score': 9}
+        )
+        assert response.status_code == HTTPStatus.OK
+        assert self.get_rating(admin_client, title_id) == 5, (
+            'Проверьте, что рейтинг произведения обновляется при изменении '
+            'оценки в отзыве.'
+        )
+
+        response = admin_client.delete(self.REVIEW_URL_TEMPLATE.format(
+            title_id=title_id, review_id=reviews[0]['id']))
+        assert response.status_code == HTTPStatus.NO_CONTENT
+        assert self.get_rating(admin_client, title_id) == 1, (
+            'Проверьте, что рейтинг произведения обновляется при удалении '
+            'отзыва.'
+        )
+
+        user.delete()
+        assert self.get_rating(admin_client, title_id) is None, (
+            'Проверьте, что рейтинг произведения обновляется при удалении '
+            'автора отзыва.'
+        )
+
+    def test_02_rebuild_ratings(self, admin_client, admin):
+        _, titles = create_reviews(admin_client, {admin: admin_client})
+        Title.objects.update(rating_sum=0, rating_count=0)
+        with pytest.raises(CommandError):
+            call_command('rebuild_ratings', '--check')
+
+        call_command('rebuild_ratings')
+        call_command('rebuild_ratings', '--check')
+        assert self.get_rating(admin_client, titles[0]['id']) == 5
+
+    def test_03_stale_instances(self, admin, user):
+        title = Title.objects.create(name='Произведение', year=2000)
+        Review.objects.create(title=title, author=admin, text='Отзыв',
+                              score=8)
+        review = Review.objects.create(title=title, author=user,
+                                       text='Отзыв', score=5)
+        first = Review.objects.get(pk=review.pk)
+        second = Review.objects.get(pk=review.pk)
+        first.score = 7
+        first.save()
+        second.score = 9
+        second.save()
+        assert not inconsistent_ratings().exists(), (
+            'Проверьте, что сохранение устаревшей копии отзыва не сдвигает '
+            'рейтинг произведения.'
+        )
+
+        first = Review.objects.get(pk=review.pk)
+        second = Review.objects.get(pk=review.pk)
+        first.delete()
+        second.delete()
+        title.refresh_from_db()
+        assert (title.rating_sum, title.rating_count) == (8, 1), (
+            'Проверьте, что повторное удаление отзыва не уменьшает рейтинг '
+            'произведения дважды.'
+        )
@@ -0,0 +1,101 @@
+import pytest
+from rest_framework.pagination import PageNumberPagination
+
+from reviews.models import (Category, Comment, Genre, GenreTitle, Review,
+                            Title)
+
+
+def create_authors(django_user_model, count):
+    django_user_model.objects.bulk_create(
+        django_user_model(username=f'author{idx}',
+                          email=f'author{idx}@yamdb.fake')
+        for idx in range(count)
+    )
+    return list(django_user_model.objects.all())
+
+
+@pytest.mark.django_db(transaction=True)
+class Test09QueryCount:
+
+    TITLES_URL = '/api/v1/titles/'
+
+    @pytest.mark.parametrize('page_size', (5, 50, 500))
+    def test_01_titles_list_queries(self, client, monkeypatch,
+                                    django_assert_num_queries, page_size):
+        monkeypatch.setattr(PageNumberPagination, 'page_size', page_size)
+        category = Category.objects.create(name='Фильм', slug='films')
+        Genre.objects.bulk_create(
+            Genre(name=f'Жанр {idx}', slug=f'genre-{idx}')
+            for idx in range(3)
+        )
+        genres = list(Genre.objects.all())
+        Title.objects.bulk_create(
+            Title(name=f'Произведение {idx}', year=2000, category=category)
+            for idx in range(page_size)
+        )
+        GenreTitle.objects.bulk_create(
+            GenreTitle(title=title, genre=genre)
+            for title in Title.objects.all()
+            for genre in genres
+        )
+
+        with django_assert_num_queries(3):
+            response = client.get(self.TITLES_URL)
+        assert len(response.json()['results']) == page_size, (
+            f'Проверьте, что GET-запрос к `{self.TITLES_URL}` возвращает '
+            'полную страницу произведений.'
+        )
+
+    def test_02_title_detail_queries(self, client, django_assert_num_queries):
+        category = Category.objects.create(name='Фильм', slug='films')
+        genre = Genre.objects.create(name='Драма', slug='drama')
+        title = Title.objects.create(name='Произведение', year=2000,
+                                     category=category)
+        title.genre.add(genre)
+
+        with django_assert_num_queries(2):
+            response = client.get(f'{self.TITLES_URL}{title.id}/')
+        assert response.json()['genre'] == [
+            {'name': 'Драма', 'slug': 'drama'}
+        ]
+
+    @pytest.mark.parametrize('page_size', (5, 50))
+    def test_03_reviews_list_queries(self, client, monkeypatch,
+                                     django_user_model,
+                                     django_assert_num_queries, page_size):
+        monkeypatch.setattr(PageNumberPagination, 'page_size', page_size)
+        title = Title.objects.create(name='Произведение', year=2000)
+        Review.objects.bulk_create(
+            Review(title=title, author=author, text='Отзыв', score=5)
+            for author in create_authors(django_user_model, page_size)
+        )
+
+        url = f'{self.TITLES_URL}{title.id}/reviews/'
+        with django_assert_num_queries(3):
+            response = client.get(url)
+        assert len(response.json()['results']) == page_size, (
+            f'Проверьте, что GET-запрос к `{url}` возвращает полную страницу '
+            'отзывов.'
+        )
+
+    @pytest.mark.parametrize('page_size', (5, 50))
+    def test_04_comments_list_queries(self, client, monkeypatch,
+                                      django_user_model,
+                                      django_assert_num_queries, page_size):
+        monkeypatch.setattr(PageNumberPagination, 'page_size', page_size)
+        authors = create_authors(django_user_model, page_size)
+        title = Title.objects.create(name='Произведение', year=2000)
+        review = Review.objects.create(
+            title=title, author=authors[0], text='Отзыв', score=5)
+        Comment.objects.bulk_create(
+            Comment(review=review, author=author, text='Комментарий')
+            for author in authors
+        )
+
+        url = f'{self.TITLES_URL}{title.id}/reviews/{review.id}/comments/'
+        with django_assert_num_queries(3):
+            response = client.get(url)
+        assert len(response.json()['results']) == page_size, (
+            f'Проверьте, что GET-запрос к `{url}` возвращает полную страницу '
+            'комментариев.'
+        )
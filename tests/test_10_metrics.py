@@ -0,0 +1,84 @@
+import time
+from http import HTTPStatus
+
+import pytest
+
+from api.metrics import QueryBudgetExceeded, registry
+from api.v1.serializers import FastListSerializer
+from api.v1.views import TitleViewSet
+
+
+@pytest.fixture
+def metrics_enabled(settings):
+    settings.REQUEST_METRICS = {
+        'ENABLED': True,
+        'WINDOW': 100,
+        'BUDGETS': {},
+        'STRICT': True,
+    }
+    registry.reset()
+    yield settings.REQUEST_METRICS
+    registry.reset()
+
+
+@pytest.mark.django_db(transaction=True)
+class Test10RequestMetrics:
+
+    TITLES_URL = '/api/v1/titles/'
+    METRICS_URL = '/api/v1/metrics/'
+
+    def test_01_server_timing(self, client, metrics_enabled):
+        response = client.get(self.TITLES_URL)
+        assert response.status_code == HTTPStatus.OK
+        assert 'db;dur=' in response['Server-Timing'], (
+            'Проверьте, что при включённых метриках ответ содержит '
+            'заголовок `Server-Timing`.'
+        )
+
+    def test_02_metrics_endpoint(self, client, user_client, admin_client,
+                                 metrics_enabled):
+        client.get(self.TITLES_URL)
+        client.get(self.TITLES_URL)
+        assert client.get(self.METRICS_URL).status_code == (
+            HTTPStatus.UNAUTHORIZED
+        )
+        assert user_client.get(self.METRICS_URL).status_code == (
+            HTTPStatus.FORBIDDEN
+        )
+        response = admin_client.get(self.METRICS_URL)
+        assert response.status_code == HTTPStatus.OK
+        stats = response.json()['routes']['titles-list']
+        assert stats['requests'] == 2
+        assert set(stats['queries']) == {'p50', 'p95', 'p99'}
+
+    def test_03_budget_exceeded(self, client, metrics_enabled):
+        metrics_enabled['BUDGETS'] = {'titles-list': {'queries': 0}}
+        with pytest.raises(QueryBudgetExceeded):
+            client.get(self.TITLES_URL)
+
+    def test_04_disabled_by_default(self, client):
+        response = client.get(self.TITLES_URL)
+        assert 'Server-Timing' not in response
+
+    def test_05_serialize_time(self, client, metrics_enabled, monkeypatch):
+        filter_queryset = TitleViewSet.filter_queryset
+        to_representation = FastListSerializer.to_representation
+
+        def slow_filter(view, queryset):
+            time.sleep(0.1)
+            return filter_queryset(view, queryset)
+
+        def slow_representation(serializer, data):
+            time.sleep(0.05)
+            return to_representation(serializer, data)
+
+        monkeypatch.setattr(TitleViewSet, 'filter_queryset', slow_filter)
+        monkeypatch.setattr(
+            FastListSerializer, 'to_representation', slow_representation)
+        client.get(self.TITLES_URL)
+        stats = registry.summary()['titles-list']
+        assert 50 <= stats['serialize_ms']['p50'] < 100, (
+            'Проверьте, что `serialize_ms` измеряет только время '
+            'сериализатора, а не всего представления.'
+        )
+        assert stats['total_ms']['p50'] >= 150
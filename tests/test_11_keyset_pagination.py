@@ -0,0 +1,66 @@
+from http import HTTPStatus
+
+import pytest
+from django.utils import timezone
+
+from reviews.models import Comment, Review, Title
+
+
+@pytest.mark.django_db(transaction=True)
+class Test11KeysetPagination:
+
+    def create_reviews(self, django_user_model, count):
+        title = Title.objects.create(name='Произведение', year=2000)
+        for idx in range(count):
+            author = django_user_model.objects.create(
+                username=f'author{idx}', email=f'author{idx}@yamdb.fake')
+            Review.objects.create(
+                title=title, author=author, text=f'Отзыв {idx}', score=5)
+        return title
+
+    def collect(self, client, url):
+        ids = []
+        while url:
+            response = client.get(url)
+            assert response.status_code == HTTPStatus.OK
+            data = response.json()
+            assert 'count' not in data
+            ids.extend(item['id'] for item in data['results'])
+            url = data['next']
+        return ids
+
+    def test_01_reviews_cursor_walks_all_pages(self, client,
+                                               django_user_model):
+        title = self.create_reviews(django_user_model, 12)
+        Review.objects.filter(id__lte=6).update(pub_date=timezone.now())
+        url = f'/api/v1/titles/{title.id}/reviews/'
+
+        ids = self.collect(client, f'{url}?cursor=')
+        expected = list(Review.objects.order_by(
+            '-pub_date', '-id').values_list('id', flat=True))
+        assert ids == expected, (
+            'Проверьте, что постраничный обход по курсору возвращает все '
+            'отзывы без повторов и пропусков.'
+        )
+
+        response = client.get(url)
+        assert response.json()['count'] == 12, (
+            'Без параметра `cursor` должна сохраняться постраничная '
+            'пагинация по номеру страницы.'
+        )
+
+    def test_02_comments_cursor(self, client, django_user_model):
+        title = self.create_reviews(django_user_model, 1)
+        review = Review.objects.get()
+        for idx in range(7):
+            Comment.objects.create(
+                review=review, author=review.author, text=f'Коммент {idx}')
+        url = (f'/api/v1/titles/{title.id}/reviews/{review.id}/comments/'
+               '?cursor=')
+        assert len(set(self.collect(client, url))) == 7
+
+    def test_03_invalid_cursor(self, client, django_user_model):
+        title = self.create_reviews(django_user_model, 1)
+        response = client.get(
+            f'/api/v1/titles/{title.id}/reviews/?cursor=broken')
+        assert response.status_code == HTTPStatus.NOT_FOUND
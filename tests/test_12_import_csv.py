@@ -0,0 +1,80 @@
+import pytest
+from django.conf import settings
+from django.core.management import call_command
+from django.db import connection
+
+from reviews.importer import deferred_indexes, get_deferrable_ddl
+from reviews.models import Comment, GenreTitle, Review, Title
+from reviews.ratings import inconsistent_ratings
+
+
+@pytest.mark.django_db(transaction=True)
+class Test12ImportCsv:
+
+    def test_01_import_static_data(self, django_user_model):
+        call_command('import_csv', batch_size=10)
+
+        assert django_user_model.objects.count() == 5
+        assert Title.objects.count() == 32
+        assert GenreTitle.objects.count() == 42
+        assert Review.objects.count() == 72
+        assert Comment.objects.count() == 3
+
+        review = Review.objects.get(pk=1)
+        assert review.author.username == 'bingobongo'
+        assert review.pub_date.year == 2019, (
+            'Проверьте, что при импорте сохраняется `pub_date` из csv-файла.'
+        )
+        assert Title.objects.get(pk=1).category.slug == 'movie'
+        assert not inconsistent_ratings().exists(), (
+            'Проверьте, что после импорта пересчитываются рейтинги.'
+        )
+
+    def test_02_import_keeps_sequences(self, admin_client):
+        call_command('import_csv')
+        title = Title.objects.create(name='Новое', year=2000)
+        assert title.pk > 32
+
+    def test_03_sharded_import_matches_serial(self):
+        call_command('import_csv')
+        expected = list(Review.objects.order_by('id').values_list(
+            'id', 'text', 'author_id', 'score', 'pub_date'))
+        Comment.objects.all().delete()
+        Review.objects.all().delete()
+
+        call_command(
+            'import_csv', workers=2, shard_size=512, defer_indexes=True,
+            only=['review.csv', 'comments.csv'],
+            path=settings.BASE_DIR / 'static' / 'data',
+        )
+        assert list(Review.objects.order_by('id').values_list(
+            'id', 'text', 'author_id', 'score', 'pub_date')) == expected, (
+            'Проверьте, что параллельный импорт по шардам не разрывает '
+            'многострочные отзывы.'
+        )
+        assert not inconsistent_ratings().exists()
+
+    def test_04_deferred_indexes(self, client):
+        if connection.vendor != 'sqlite':
+            pytest.skip('Триггеры индекса создаются только в SQLite')
+        call_command('import_csv', only=['users.csv', 'category.csv',
+                                         'genre.csv', 'titles.csv'])
+        before = get_deferrable_ddl(Review)
+        assert {name for _, name, _ in before} >= {
+            'reviews_review_fts_ai', 'review_title_pub_date_idx'}
+        assert any(name.startswith('reviews_review_title_id')
+                   for _, name, _ in before)
+        with deferred_indexes([Review]):
+            assert get_deferrable_ddl(Review) == [], (
+                'Проверьте, что --defer-indexes удаляет индексы внешних '
+                'ключей и триггеры полнотекстового индекса на время загрузки.'
+            )
+            call_command('import_csv', only=['review.csv'])
+        assert sorted(get_deferrable_ddl(Review)) == sorted(before)
+        review = Review.objects.get(pk=1)
+        response = client.get(
+            f'/api/v1/titles/{review.title_id}/reviews/',
+            {'search': review.text.split()[0]})
+        assert review.id in [
+            item['id'] for item in response.json()['results']
+        ], 'Проверьте, что полнотекстовый индекс перестроен после загрузки.'
@@ -0,0 +1,72 @@
+from http import HTTPStatus
+
+import pytest
+
+from reviews.models import Category
+
+
+@pytest.mark.django_db(transaction=True)
+class Test13ListCache:
+
+    CATEGORIES_URL = '/api/v1/categories/'
+
+    def test_01_cached_list_and_invalidation(self, client, admin_client,
+                                             django_assert_num_queries):
+        Category.objects.create(name='Фильм', slug='films')
+        assert client.get(self.CATEGORIES_URL).json()['count'] == 1
+        with django_assert_num_queries(0):
+            response = client.get(self.CATEGORIES_URL)
+        assert response.json()['count'] == 1, (
+            f'Проверьте, что повторный GET-запрос к `{self.CATEGORIES_URL}` '
+            'обслуживается из кеша.'
+        )
+
+        admin_client.post(
+            self.CATEGORIES_URL, data={'name': 'Книги', 'slug': 'books'})
+        assert client.get(self.CATEGORIES_URL).json()['count'] == 2, (
+            'Проверьте, что кеш списка категорий сбрасывается после '
+            'создания категории.'
+        )
+        admin_client.delete(f'{self.CATEGORIES_URL}books/')
+        assert client.get(self.CATEGORIES_URL).json()['count'] == 1, (
+            'Проверьте, что кеш списка категорий сбрасывается после '
+            'удаления категории.'
+        )
+
+    def test_02_search_and_page_keys(self, client):
+        Category.objects.create(name='Фильм', slug='films')
+        Category.objects.create(name='Книги', slug='books')
+        assert client.get(self.CATEGORIES_URL).json()['count'] == 2
+        response = client.get(f'{self.CATEGORIES_URL}?search=Книги')
+        assert response.json()['count'] == 1
+
+    def test_03_conditional_get(self, client):
+        Category.objects.create(name='Фильм', slug='films')
+        response = client.get(self.CATEGORIES_URL)
+        etag = response['ETag']
+        assert response.has_header('Last-Modified')
+
+        response = client.get(self.CATEGORIES_URL, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == HTTPStatus.NOT_MODIFIED, (
+            'Проверьте, что при совпадении `If-None-Match` возвращается '
+            'ответ со статусом 304.'
+        )
+
+        Category.objects.create(name='Книги', slug='books')
+        response = client.get(self.CATEGORIES_URL, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == HTTPStatus.OK
+        assert response['ETag'] != etag
+
+    def test_04_links_follow_host(self, client):
+        Category.objects.bulk_create(
+            Category(name=f'Категория {idx}', slug=f'category-{idx}')
+            for idx in range(6)
+        )
+        response = client.get(self.CATEGORIES_URL, HTTP_HOST='first.test')
+        assert response.json()['next'].startswith('http://first.test/')
+        response = client.get(
+            self.CATEGORIES_URL, HTTP_HOST='second.test', secure=True)
+        assert response.json()['next'].startswith('https://second.test/'), (
+            'Проверьте, что закешированный список не отдает ссылки '
+            'пагинации с хостом и схемой другого запроса.'
+        )
@@ -0,0 +1,129 @@
+from http import HTTPStatus
+
+import pytest
+from django.db import transaction
+
+from reviews.models import Category, Comment, Genre, Review, Title
+from reviews.ratings import recalculate_ratings
+
+
+@pytest.mark.django_db(transaction=True)
+class Test14ConditionalGet:
+
+    def assert_not_modified(self, client, url, django_assert_num_queries,
+                            queries=1):
+        response = client.get(url)
+        assert response.status_code == HTTPStatus.OK
+        etag = response['ETag']
+        # Запросы только за состоянием строк, без сериализации.
+        with django_assert_num_queries(queries):
+            response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == HTTPStatus.NOT_MODIFIED, (
+            f'Проверьте, что GET-запрос к `{url}` с актуальным '
+            '`If-None-Match` возвращает ответ со статусом 304, читая из '
+            'базы только состояние строк.'
+        )
+        return etag
+
+    def test_01_title_detail(self, client, admin, django_assert_num_queries):
+        category = Category.objects.create(name='Фильм', slug='films')
+        title = Title.objects.create(name='Фильм', year=2000,
+                                     category=category)
+        url = f'/api/v1/titles/{title.id}/'
+        etag = self.assert_not_modified(
+            client, url, django_assert_num_queries, queries=2)
+
+        Review.objects.create(title=title, author=admin, text='Да', score=7)
+        response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == HTTPStatus.OK
+        assert response.json()['rating'] == 7
+        etag = response['ETag']
+
+        category.name = 'Кино'
+        category.save()
+        response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == HTTPStatus.OK
+        assert response.json()['category']['name'] == 'Кино'
+
+    def test_02_review_and_comment_lists(self, client, admin,
+                                         django_assert_num_queries):
+        title = Title.objects.create(name='Фильм', year=2000)
+        review = Review.objects.create(
+            title=title, author=admin, text='Да', score=7)
+        reviews_url = f'/api/v1/titles/{title.id}/reviews/'
+        comments_url = f'{reviews_url}{review.id}/comments/'
+        reviews_etag = self.assert_not_modified(
+            client, reviews_url, django_assert_num_queries)
+        comments_etag = self.assert_not_modified(
+            client, comments_url, django_assert_num_queries)
+
+        Comment.objects.create(review=review, author=admin, text='Нет')
+        response = client.get(comments_url, HTTP_IF_NONE_MATCH=comments_etag)
+        assert response.status_code == HTTPStatus.OK
+        response = client.get(reviews_url, HTTP_IF_NONE_MATCH=reviews_etag)
+        assert response.status_code == HTTPStatus.NOT_MODIFIED
+
+        review.text = 'Передумал'
+        review.save()
+        response = client.get(reviews_url, HTTP_IF_NONE_MATCH=reviews_etag)
+        assert response.status_code == HTTPStatus.OK
+        assert response.json()['results'][0]['text'] == 'Передумал'
+
+    def test_03_missing_title(self, client):
+        response = client.get('/api/v1/titles/404/reviews/')
+        assert response.status_code == HTTPStatus.NOT_FOUND
+        assert not response.has_header('ETag')
+
+    def test_04_writes_without_signals(self, client, admin):
+        title = Title.objects.create(name='Фильм', year=2000)
+        url = f'/api/v1/titles/{title.id}/'
+        etag = client.get(url)['ETag']
+        Review.objects.create(title=title, author=admin, text='Да', score=7)
+        Title.objects.filter(pk=title.pk).update(rating_sum=3, rating_count=1)
+        response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == HTTPStatus.OK
+        etag = response['ETag']
+        recalculate_ratings()
+        response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == HTTPStatus.OK, (
+            'Проверьте, что ETag произведения учитывает изменения рейтинга '
+            'в обход сигналов.'
+        )
+        assert response.json()['rating'] == 7
+        etag = response['ETag']
+        genre = Genre.objects.create(name='Драма', slug='drama')
+        title.genre.add(genre)
+        response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == HTTPStatus.OK
+        assert response.json()['genre'] == [
+            {'name': 'Драма', 'slug': 'drama'}]
+
+    def test_05_deleted_parent(self, client, admin):
+        title = Title.objects.create(name='Фильм', year=2000)
+        review = Review.objects.create(
+            title=title, author=admin, text='Да', score=7)
+        url = f'/api/v1/titles/{title.id}/reviews/{review.id}/comments/'
+        etag = client.get(url)['ETag']
+        Review.objects.filter(pk=review.pk).delete()
+        response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == HTTPStatus.NOT_FOUND, (
+            'Проверьте, что после удаления отзыва старый ETag не даёт 304.'
+        )
+
+    def test_06_bump_after_commit(self, client, admin):
+        title = Title.objects.create(name='Фильм', year=2000)
+        review = Review.objects.create(
+            title=title, author=admin, text='Да', score=7)
+        url = f'/api/v1/titles/{title.id}/reviews/'
+        etag = client.get(url)['ETag']
+        with transaction.atomic():
+            review.text = 'Передумал'
+            review.save()
+            response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+            assert response.status_code == HTTPStatus.NOT_MODIFIED, (
+                'Проверьте, что версия меняется только после фиксации '
+                'транзакции.'
+            )
+        response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == HTTPStatus.OK
+        assert response.json()['results'][0]['text'] == 'Передумал'
@@ -0,0 +1,78 @@
+from http import HTTPStatus
+
+import pytest
+from django.db import connection
+
+from reviews.models import Review, Title
+
+
+@pytest.mark.django_db(transaction=True)
+class Test15FullTextSearch:
+
+    TITLES_URL = '/api/v1/titles/'
+
+    def search(self, client, url, query):
+        response = client.get(url, {'search': query})
+        assert response.status_code == HTTPStatus.OK
+        return response.json()['results']
+
+    def test_01_titles(self, client):
+        Title.objects.create(name='Терминатор', year=1984,
+                             description='Киборг из будущего')
+        Title.objects.create(name='Крепкий орешек', year=1988,
+                             description='Полицейский против террористов')
+        Title.objects.create(name='Будущее', year=2000,
+                             description='Будущее будущего')
+
+        results = self.search(client, self.TITLES_URL, 'будущ')
+        assert [title['name'] for title in results] == [
+            'Будущее', 'Терминатор'
+        ], (
+            'Проверьте, что поиск по произведениям ищет по названию и '
+            'описанию и сортирует результаты по релевантности.'
+        )
+        assert self.search(client, self.TITLES_URL, 'крепкий ОРЕШ')
+        assert not self.search(client, self.TITLES_URL, 'крепкий киборг')
+        assert not self.search(client, self.TITLES_URL, '"*')
+
+    def test_02_index_follows_changes(self, client):
+        title = Title.objects.create(name='Терминатор', year=1984)
+        title.name = 'Чужой'
+        title.save()
+        assert not self.search(client, self.TITLES_URL, 'Терминатор')
+        assert self.search(client, self.TITLES_URL, 'Чужой')
+        title.delete()
+        assert not self.search(client, self.TITLES_URL, 'Чужой')
+
+    def test_03_reviews(self, client, admin, user):
+        title = Title.objects.create(name='Терминатор', year=1984)
+        Review.objects.create(title=title, author=admin, score=9,
+                              text='Отличная погоня')
+        Review.objects.create(title=title, author=user, score=2,
+                              text='Скучно')
+        results = self.search(
+            client, f'{self.TITLES_URL}{title.id}/reviews/', 'погон')
+        assert [review['author'] for review in results] == [admin.username]
+
+    def test_04_users(self, admin_client, admin, user):
+        results = self.search(admin_client, '/api/v1/users/', user.email)
+        assert [found['username'] for found in results] == [user.username]
+
+    def test_05_triggers_after_migrate(self):
+        if connection.vendor != 'sqlite':
+            pytest.skip('Триггеры индекса создаются только в SQLite')
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT name FROM sqlite_master "
+                "WHERE type = 'trigger' AND name LIKE '%_fts_%'"
+            )
+            triggers = {row[0] for row in cursor.fetchall()}
+        expected = {
+            f'{table}_fts_{suffix}'
+            for table in ('reviews_title', 'reviews_review', 'users_user')
+            for suffix in ('ai', 'ad', 'au')
+        }
+        assert expected <= triggers, (
+            'Проверьте, что после миграций существуют все триггеры '
+            f'полнотекстового индекса, не хватает: {expected - triggers}'
+        )
@@ -0,0 +1,169 @@
+from http import HTTPStatus
+
+import pytest
+from django.contrib.auth.tokens import default_token_generator
+from rest_framework_simplejwt.tokens import AccessToken
+
+from users.authentication import ClaimsJWTAuthentication, forget_user_state
+from users.cache import UserCache
+
+
+@pytest.mark.django_db(transaction=True)
+class Test16ClaimsAuthentication:
+
+    TITLES_URL = '/api/v1/titles/'
+    CATEGORIES_URL = '/api/v1/categories/'
+
+    def test_01_token_claims(self, client, admin):
+        response = client.post('/api/v1/auth/token/', data={
+            'username': admin.username,
+            'confirmation_code': default_token_generator.make_token(admin),
+        })
+        assert response.status_code == HTTPStatus.OK
+        token = AccessToken(response.json()['token'])
+        assert token['role'] == admin.role
+        assert token['username'] == admin.username
+        assert token['is_superuser'] is False
+
+    def test_02_no_user_query_per_request(self, admin_client,
+                                          django_assert_num_queries):
+        with django_assert_num_queries(2):
+            admin_client.get(self.TITLES_URL)
+        with django_assert_num_queries(1):
+            response = admin_client.get(self.TITLES_URL)
+        assert response.status_code == HTTPStatus.OK, (
+            'Проверьте, что аутентифицированный запрос не загружает '
+            'пользователя из базы данных при каждом обращении.'
+        )
+
+    def test_03_demotion_takes_effect(self, admin_client, admin):
+        data = {'name': 'Фильм', 'slug': 'films'}
+        response = admin_client.post(self.CATEGORIES_URL, data=data)
+        assert response.status_code == HTTPStatus.CREATED
+
+        admin.role = admin.USER
+        admin.save()
+        data = {'name': 'Книги', 'slug': 'books'}
+        response = admin_client.post(self.CATEGORIES_URL, data=data)
+        assert response.status_code == HTTPStatus.FORBIDDEN, (
+            'Проверьте, что после понижения роли токен с прежней ролью '
+            'не даёт прав администратора.'
+        )
+
+    def test_04_inactive_user_rejected(self, user_client, user):
+        user.is_active = False
+        user.save()
+        response = user_client.get('/api/v1/users/me/')
+        assert response.status_code == HTTPStatus.UNAUTHORIZED
+
+    def test_05_profile_uses_full_model(self, user_client, user):
+        response = user_client.patch(
+            '/api/v1/users/me/', data={'username': 'RenamedUser'})
+        assert response.status_code == HTTPStatus.OK
+        assert response.json()['username'] == 'RenamedUser'
+        assert response.json()['bio'] == user.bio
+
+    def get_token(self, client, user):
+        response = client.post('/api/v1/auth/token/', data={
+            'username': user.username,
+            'confirmation_code': default_token_generator.make_token(user),
+        })
+        return AccessToken(response.json()['token'])
+
+    def test_06_user_built_from_claims(self, client, admin,
+                                       django_user_model):
+        token = self.get_token(client, admin)
+        django_user_model.objects.filter(pk=admin.pk).update(
+            username='renamed_admin')
+        forget_user_state(admin.pk)
+        user = ClaimsJWTAuthentication().get_user(token)
+        assert user.username == admin.username, (
+            'Проверьте, что пользователь строится из claims токена.'
+        )
+        assert user.is_admin
+
+    def test_07_outdated_claims_rejected(self, client, admin):
+        token = self.get_token(client, admin)
+        admin.role = admin.USER
+        admin.save()
+        response = client.get(
+            '/api/v1/users/me/', HTTP_AUTHORIZATION=f'Bearer {token}')
+        assert response.status_code == HTTPStatus.UNAUTHORIZED, (
+            'Проверьте, что токен с прежней ролью отклоняется после '
+            'понижения роли.'
+        )
+        token = self.get_token(client, admin)
+        response = client.get(
+            '/api/v1/users/me/', HTTP_AUTHORIZATION=f'Bearer {token}')
+        assert response.status_code == HTTPStatus.OK
+        assert response.json()['role'] == admin.USER
+
+
+@pytest.mark.django_db(transaction=True)
+class Test16UserCache:
+
+    def test_01_cache_hits_and_invalidation(self, admin_client, user):
+        url = f'/api/v1/users/{user.username}/'
+        assert admin_client.get(url).status_code == HTTPStatus.OK
+        response = admin_client.get(url)
+        assert response.json()['bio'] == user.bio
+
+        user.bio = 'Новая биография'
+        user.save()
+        response = admin_client.get(url)
+        assert response.json()['bio'] == 'Новая биография', (
+            'Проверьте, что кеш пользователей сбрасывается при сохранении '
+            'пользователя.'
+        )
+
+        stats = admin_client.get('/api/v1/metrics/').json()['user_cache']
+        assert stats['hits'] >= 1
+        assert stats['misses'] >= 2
+
+    def test_02_lru_eviction(self, django_user_model):
+        cache = UserCache(max_size=2, ttl=60)
+        users = [
+            django_user_model.objects.create(
+                username=f'user{idx}', email=f'user{idx}@yamdb.fake')
+            for idx in range(3)
+        ]
+        for user in users:
+            cache.get_by_id(user.pk)
+        cache.get_by_username('user2')
+        assert cache.stats()['size'] == 2
+        assert cache.stats()['hits'] == 1
+        cache.get_by_username('user0')
+        assert cache.stats()['misses'] == 4
+
+    def test_03_writes_use_fresh_row(self, admin_client, user_client, user,
+                                     django_user_model):
+        url = f'/api/v1/users/{user.username}/'
+        assert admin_client.get(url).status_code == HTTPStatus.OK
+        user_client.get('/api/v1/users/me/')
+        # Изменение другим процессом: сигналы не срабатывают, и кеш
+        # этого процесса остаётся устаревшим.
+        django_user_model.objects.filter(pk=user.pk).update(
+            bio='Обновлено другим воркером', last_name='Фамилия')
+        response = user_client.patch(
+            '/api/v1/users/me/', data={'first_name': 'Имя'})
+        assert response.status_code == HTTPStatus.OK
+        django_user_model.objects.filter(pk=user.pk).update(is_active=False)
+        response = admin_client.patch(url, data={'first_name': 'Другое'})
+        assert response.status_code == HTTPStatus.NOT_FOUND
+        user.refresh_from_db()
+        assert user.bio == 'Обновлено другим воркером', (
+            'Проверьте, что изменение пользователя не перезаписывает поля '
+            'устаревшей копией из кеша.'
+        )
+        assert user.last_name == 'Фамилия'
+        assert user.first_name == 'Имя'
+        assert user.is_active is False, (
+            'Проверьте, что PATCH не активирует деактивированного '
+            'пользователя.'
+        )
+        django_user_model.objects.filter(pk=user.pk).update(is_active=True)
+        response = admin_client.patch(url, data={'first_name': 'Другое'})
+        assert response.status_code == HTTPStatus.OK
+        user.refresh_from_db()
+        assert user.bio == 'Обновлено другим воркером'
+        assert user.first_name == 'Другое'
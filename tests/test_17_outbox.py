@@ -0,0 +1,67 @@
+from http import HTTPStatus
+
+import pytest
+from django.core import mail
+from django.core.management import call_command
+
+from users.models import OutboxEmail
+
+
+class BrokenBackend:
+
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def open(self):
+        raise ConnectionError('SMTP недоступен')
+
+
+@pytest.mark.django_db(transaction=True)
+class Test17Outbox:
+
+    URL_SIGNUP = '/api/v1/auth/signup/'
+
+    def signup(self, client):
+        response = client.post(self.URL_SIGNUP, data={
+            'email': 'valid@yamdb.fake',
+            'username': 'valid_username',
+        })
+        assert response.status_code == HTTPStatus.OK
+
+    def test_01_signup_enqueues_email(self, client):
+        self.signup(client)
+        assert len(mail.outbox) == 0, (
+            'Письмо с кодом подтверждения должно отправляться воркером, '
+            'а не во время запроса.'
+        )
+        assert OutboxEmail.objects.filter(sent__isnull=True).count() == 1
+
+        call_command('send_outbox')
+        assert len(mail.outbox) == 1
+        assert mail.outbox[0].to == ['valid@yamdb.fake']
+        assert not OutboxEmail.objects.filter(sent__isnull=True).exists()
+        assert OutboxEmail.objects.get().body == '', (
+            'Проверьте, что код подтверждения не хранится в очереди после '
+            'отправки письма.'
+        )
+
+        call_command('send_outbox')
+        assert len(mail.outbox) == 1
+
+    def test_02_failed_delivery_is_retried(self, client, settings):
+        self.signup(client)
+        settings.EMAIL_BACKEND = 'tests.test_17_outbox.BrokenBackend'
+        call_command('send_outbox')
+        email = OutboxEmail.objects.get()
+        assert email.sent is None
+        assert email.attempts == 1
+        assert 'SMTP' in email.last_error
+
+        settings.EMAIL_BACKEND = 'django.core.mail.backends.locmem.EmailBackend'
+        call_command('send_outbox')
+        assert len(mail.outbox) == 0, (
+            'Повторная попытка должна выполняться после задержки.'
+        )
+        OutboxEmail.objects.update(next_attempt=email.created)
+        call_command('send_outbox')
+        assert len(mail.outbox) == 1
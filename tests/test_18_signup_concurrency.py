@@ -0,0 +1,64 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http import HTTPStatus
+
+import pytest
+from django.db import connection
+from rest_framework.test import APIClient
+
+from users.models import OutboxEmail
+
+
+@pytest.mark.django_db(transaction=True)
+class Test18SignupConcurrency:
+
+    URL_SIGNUP = '/api/v1/auth/signup/'
+
+    @pytest.fixture(autouse=True)
+    def no_throttling(self, settings):
+        settings.AUTH_THROTTLE_RATES = dict.fromkeys(
+            settings.AUTH_THROTTLE_RATES)
+
+    def signup(self, data):
+        # Тестовая база SQLite в памяти с общим кешем сразу отвечает
+        # "table is locked" вместо ожидания блокировки: повторяем запрос.
+        # Исключения не пробрасываются в клиент, иначе тестовый клиент
+        # поднимет исключение чужого потока.
+        client = APIClient(raise_request_exception=False)
+        try:
+            for _ in range(50):
+                status = client.post(self.URL_SIGNUP, data=data).status_code
+                if status != HTTPStatus.INTERNAL_SERVER_ERROR:
+                    return status
+                time.sleep(0.01)
+            raise AssertionError('База данных осталась заблокированной')
+        finally:
+            connection.close()
+
+    def test_01_single_query_validation(self, client, django_user_model,
+                                        django_assert_num_queries):
+        data = {'email': 'valid@yamdb.fake', 'username': 'valid_username'}
+        django_user_model.objects.create(**data)
+        # SELECT по email/username, BEGIN и INSERT письма в очередь.
+        with django_assert_num_queries(3):
+            response = client.post(self.URL_SIGNUP, data=data)
+        assert response.status_code == HTTPStatus.OK
+
+    def test_02_parallel_signups(self, django_user_model):
+        data = [
+            {'email': 'same@yamdb.fake', 'username': 'same_user'}
+        ] * 8 + [
+            {'email': 'same@yamdb.fake', 'username': f'other_{idx}'}
+            for idx in range(8)
+        ]
+        with ThreadPoolExecutor(8) as pool:
+            statuses = list(pool.map(self.signup, data))
+
+        assert statuses[:8] == [HTTPStatus.OK] * 8, (
+            'Повторная регистрация с теми же `username` и `email` должна '
+            'успешно возвращать код подтверждения.'
+        )
+        assert set(statuses[8:]) == {HTTPStatus.BAD_REQUEST}
+        assert django_user_model.objects.filter(
+            email='same@yamdb.fake').count() == 1
+        assert OutboxEmail.objects.count() == 8
@@ -0,0 +1,124 @@
+from http import HTTPStatus
+from unittest import mock
+
+import pytest
+
+from api.v1.throttling import SlidingWindowThrottle
+
+
+@pytest.mark.django_db(transaction=True)
+class Test19AuthThrottling:
+
+    URL_SIGNUP = '/api/v1/auth/signup/'
+    URL_TOKEN = '/api/v1/auth/token/'
+
+    @pytest.fixture(autouse=True)
+    def rates(self, settings):
+        settings.AUTH_THROTTLE_RATES = {
+            'signup_ip': '5/minute',
+            'signup_username': '2/minute',
+            'token_ip': '5/minute',
+            'token_username': '2/minute',
+        }
+
+    def signup(self, client, idx, username=None):
+        return client.post(self.URL_SIGNUP, data={
+            'username': username or f'user_{idx}',
+            'email': f'user_{idx}@yamdb.fake',
+        })
+
+    def test_01_username_limit(self, client, django_assert_num_queries):
+        for idx in range(2):
+            response = self.signup(client, idx, username='same_user')
+            assert response.status_code != HTTPStatus.TOO_MANY_REQUESTS
+        with django_assert_num_queries(0):
+            response = self.signup(client, 2, username='same_user')
+        assert response.status_code == HTTPStatus.TOO_MANY_REQUESTS, (
+            'Проверьте, что регистрация ограничена по username '
+            'и отклоняется до обращения к базе данных'
+        )
+        assert int(response['Retry-After']) > 0, (
+            'Проверьте, что ответ 429 содержит заголовок `Retry-After`'
+        )
+        response = self.signup(client, 3)
+        assert response.status_code == HTTPStatus.OK, (
+            'Проверьте, что лимит по username не затрагивает других '
+            'пользователей'
+        )
+
+    def test_02_ip_limit(self, client):
+        for idx in range(5):
+            assert self.signup(client, idx).status_code == HTTPStatus.OK
+        response = self.signup(client, 5)
+        assert response.status_code == HTTPStatus.TOO_MANY_REQUESTS, (
+            'Проверьте, что регистрация ограничена по IP-адресу'
+        )
+        response = client.post(
+            self.URL_SIGNUP,
+            data={'username': 'user_6', 'email': 'user_6@yamdb.fake'},
+            REMOTE_ADDR='10.0.0.2',
+        )
+        assert response.status_code == HTTPStatus.OK, (
+            'Проверьте, что лимит считается отдельно для каждого IP-адреса'
+        )
+
+    def test_03_token_limit(self, client, admin):
+        data = {'username': admin.username, 'confirmation_code': 'wrong'}
+        for _ in range(2):
+            response = client.post(self.URL_TOKEN, data=data)
+            assert response.status_code == HTTPStatus.BAD_REQUEST
+        response = client.post(self.URL_TOKEN, data=data)
+        assert response.status_code == HTTPStatus.TOO_MANY_REQUESTS, (
+            'Проверьте, что подбор кода подтверждения ограничен по username'
+        )
+
+    def test_04_disabled_limit(self, client, settings):
+        settings.AUTH_THROTTLE_RATES['signup_username'] = None
+        for idx in range(4):
+            response = self.signup(client, idx, username='same_user')
+            assert response.status_code != HTTPStatus.TOO_MANY_REQUESTS
+
+    def test_05_sliding_window(self, client):
+        with mock.patch.object(SlidingWindowThrottle, 'timer') as timer:
+            timer.return_value = 60 * 1000 + 30
+            for idx in range(2):
+                self.signup(client, idx, username='same_user')
+            response = self.signup(client, 2, username='same_user')
+            assert response.status_code == HTTPStatus.TOO_MANY_REQUESTS
+            # В начале следующего окна запросы прошлого окна ещё
+            # учитываются почти полностью.
+            timer.return_value = 60 * 1001 + 1
+            self.signup(client, 3, username='same_user')
+            timer.return_value = 60 * 1001 + 2
+            response = self.signup(client, 4, username='same_user')
+            assert response.status_code == HTTPStatus.TOO_MANY_REQUESTS, (
+                'Проверьте, что лимит считается скользящим окном, '
+                'а не сбрасывается на границе минуты'
+            )
+            timer.return_value = 60 * 1001 + 45
+            response = self.signup(client, 5, username='same_user')
+            assert response.status_code != HTTPStatus.TOO_MANY_REQUESTS
+
+    def test_06_spoofed_forwarded_for(self, client, settings):
+        for idx in range(6):
+            response = client.post(
+                self.URL_SIGNUP,
+                data={'username': f'user_{idx}',
+                      'email': f'user_{idx}@yamdb.fake'},
+                HTTP_X_FORWARDED_FOR=f'10.1.0.{idx}',
+            )
+        assert response.status_code == HTTPStatus.TOO_MANY_REQUESTS, (
+            'Проверьте, что подмена заголовка X-Forwarded-For не обходит '
+            'лимит по IP-адресу'
+        )
+        settings.REST_FRAMEWORK = {
+            **settings.REST_FRAMEWORK, 'NUM_PROXIES': 1}
+        response = client.post(
+            self.URL_SIGNUP,
+            data={'username': 'user_6', 'email': 'user_6@yamdb.fake'},
+            HTTP_X_FORWARDED_FOR='10.1.0.6',
+        )
+        assert response.status_code == HTTPStatus.OK, (
+            'Проверьте, что за доверенным прокси адрес берется из '
+            'X-Forwarded-For'
+        )
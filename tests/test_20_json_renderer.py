@@ -0,0 +1,75 @@
+import io
+from datetime import datetime, timezone
+from decimal import Decimal
+from http import HTTPStatus
+
+import pytest
+from django.utils.translation import gettext_lazy
+from rest_framework.exceptions import ParseError
+from rest_framework.renderers import JSONRenderer
+
+from api.v1 import parsers, renderers
+from api.v1.parsers import FastJSONParser
+from api.v1.renderers import FastJSONRenderer
+
+DATA = {
+    'pub_date': datetime(2021, 5, 1, 12, 30, 15, 123456,
+                         tzinfo=timezone.utc),
+    'rating': None,
+    'score': Decimal('7.50'),
+    'name': 'Произведение\u2028\u2029',
+    'detail': gettext_lazy('Не найдено.'),
+    'genre': [{'name': 'Драма', 'slug': 'drama'}],
+    1: 'ключ-число',
+}
+
+
+class Test20JSONRenderer:
+
+    def test_01_same_output(self):
+        assert renderers.orjson is not None
+        assert FastJSONRenderer().render(DATA) == JSONRenderer().render(
+            DATA), (
+            'Проверьте, что быстрый рендерер выводит даты, Decimal и None '
+            'так же, как JSONRenderer из DRF'
+        )
+
+    def test_02_indent_and_none(self):
+        for media_type in ('application/json; indent=4', None):
+            assert FastJSONRenderer().render(
+                DATA, media_type, {'indent': 2}
+            ) == JSONRenderer().render(DATA, media_type, {'indent': 2})
+        assert FastJSONRenderer().render(None) == b''
+
+    def test_03_fallback_without_orjson(self, monkeypatch):
+        monkeypatch.setattr(renderers, 'orjson', None)
+        monkeypatch.setattr(parsers, 'orjson', None)
+        assert FastJSONRenderer().render(DATA) == JSONRenderer().render(
+            DATA), (
+            'Проверьте, что без orjson используется стандартный json'
+        )
+        assert FastJSONParser().parse(io.BytesIO(b'{"a": [1]}')) == {
+            'a': [1]}
+
+    def test_04_parser(self):
+        assert FastJSONParser().parse(
+            io.BytesIO('{"text": "Отзыв", "score": 7}'.encode())
+        ) == {'text': 'Отзыв', 'score': 7}
+        with pytest.raises(ParseError):
+            FastJSONParser().parse(io.BytesIO(b'{"text": '))
+
+    @pytest.mark.django_db(transaction=True)
+    def test_05_api(self, admin_client):
+        response = admin_client.post(
+            '/api/v1/categories/', data='{"name": "Фильм", "slug": "films"}',
+            content_type='application/json')
+        assert response.status_code == HTTPStatus.CREATED
+        response = admin_client.post(
+            '/api/v1/categories/', data='{"name": ',
+            content_type='application/json')
+        assert response.status_code == HTTPStatus.BAD_REQUEST, (
+            'Проверьте, что некорректный JSON возвращает статус 400'
+        )
+        response = admin_client.get('/api/v1/categories/')
+        assert response.json()['results'] == [
+            {'name': 'Фильм', 'slug': 'films'}]
@@ -0,0 +1,58 @@
+import pytest
+from rest_framework.renderers import JSONRenderer
+from rest_framework.serializers import ListSerializer
+
+from api.v1.serializers import (CommentSerializer, FastListSerializer,
+                                ReviewSerializer, TitleSerializer)
+from reviews.models import Category, Comment, Genre, Review, Title
+
+
+@pytest.mark.django_db(transaction=True)
+class Test21FastListSerializer:
+
+    @pytest.fixture
+    def titles(self, admin):
+        category = Category.objects.create(name='Фильм', slug='films')
+        genres = [
+            Genre.objects.create(name=f'Жанр {idx}', slug=f'genre-{idx}')
+            for idx in range(2)
+        ]
+        rated = Title.objects.create(
+            name='Оценённое', year=2000, category=category,
+            description='Описание')
+        rated.genre.set(genres)
+        Title.objects.create(name='Без категории', year=1990)
+        review = Review.objects.create(
+            title=rated, author=admin, text='Отзыв', score=7)
+        Comment.objects.create(review=review, author=admin, text='Текст')
+        return Title.objects.select_related('category').prefetch_related(
+            'genre').order_by('name')
+
+    @pytest.mark.parametrize('serializer_class, queryset', (
+        (TitleSerializer, None),
+        (TitleSerializer, Title.objects.order_by('name')),
+        (ReviewSerializer, Review.objects.select_related('author')),
+        (CommentSerializer, Comment.objects.select_related('author')),
+    ))
+    def test_01_same_output(self, titles, serializer_class, queryset):
+        queryset = titles if queryset is None else queryset.all()
+        fast = serializer_class(queryset, many=True)
+        assert isinstance(fast, FastListSerializer)
+        plain = ListSerializer(child=serializer_class(), instance=queryset)
+        render = JSONRenderer().render
+        assert render(fast.data) == render(plain.data), (
+            f'Проверьте, что быстрый список {serializer_class.__name__} '
+            'возвращает тот же JSON, что и ModelSerializer'
+        )
+
+    def test_02_api_shape(self, client, titles):
+        response = client.get('/api/v1/titles/')
+        results = response.json()['results']
+        assert results[0]['category'] is None
+        assert results[0]['genre'] == []
+        assert results[1]['category'] == {'name': 'Фильм', 'slug': 'films'}
+        assert results[1]['genre'] == [
+            {'name': 'Жанр 0', 'slug': 'genre-0'},
+            {'name': 'Жанр 1', 'slug': 'genre-1'},
+        ]
+        assert results[1]['rating'] == 7
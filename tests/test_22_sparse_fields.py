@@ -0,0 +1,93 @@
+from http import HTTPStatus
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from reviews.models import Category, Comment, Genre, Review, Title
+
+
+@pytest.mark.django_db(transaction=True)
+class Test22SparseFields:
+
+    TITLES_URL = '/api/v1/titles/'
+
+    @pytest.fixture
+    def title(self, admin):
+        category = Category.objects.create(name='Фильм', slug='films')
+        genre = Genre.objects.create(name='Драма', slug='drama')
+        title = Title.objects.create(
+            name='Произведение', year=2000, category=category,
+            description='Длинное описание')
+        title.genre.add(genre)
+        review = Review.objects.create(
+            title=title, author=admin, text='Отзыв', score=8)
+        Comment.objects.create(review=review, author=admin, text='Текст')
+        return title
+
+    def get(self, client, url):
+        with CaptureQueriesContext(connection) as context:
+            response = client.get(url)
+        assert response.status_code == HTTPStatus.OK, response.content
+        sql = ' '.join(query['sql'] for query in context.captured_queries)
+        return response.json(), sql, len(context)
+
+    def test_01_fields(self, client, title):
+        data, sql, queries = self.get(
+            client, f'{self.TITLES_URL}?fields=id,name,rating')
+        assert list(data['results'][0]) == ['id', 'name', 'rating'], (
+            'Проверьте, что параметр `fields` оставляет в ответе только '
+            'перечисленные поля'
+        )
+        assert data['results'][0]['rating'] == 8
+        assert '"description"' not in sql, (
+            'Проверьте, что параметр `fields` не загружает из базы '
+            'неиспользуемые колонки'
+        )
+        assert queries == 2, (
+            'Проверьте, что без `genre` и `category` не выполняются '
+            'запросы за жанрами и категориями'
+        )
+
+    def test_02_expand_and_omit(self, client, title):
+        data, sql, queries = self.get(
+            client, f'{self.TITLES_URL}?fields=id&expand=genre')
+        assert data['results'][0] == {
+            'id': title.id, 'genre': [{'name': 'Драма', 'slug': 'drama'}]}
+        assert queries == 3
+        data, sql, _ = self.get(
+            client, f'{self.TITLES_URL}{title.id}/?omit=description,genre')
+        assert list(data) == ['id', 'name', 'year', 'rating', 'category']
+        assert '"description"' not in sql
+
+    def test_03_default_shape(self, client, title):
+        data, _, _ = self.get(client, self.TITLES_URL)
+        assert list(data['results'][0]) == [
+            'id', 'name', 'year', 'rating', 'description', 'genre',
+            'category']
+
+    def test_04_unknown_fields(self, client, title):
+        for query in ('fields=id,secret', 'omit=secret', 'expand=name'):
+            response = client.get(f'{self.TITLES_URL}?{query}')
+            assert response.status_code == HTTPStatus.BAD_REQUEST, (
+                f'Проверьте, что запрос `?{query}` возвращает статус 400'
+            )
+
+    def test_05_reviews_and_comments(self, client, title):
+        review = title.reviews.get()
+        url = f'{self.TITLES_URL}{title.id}/reviews/'
+        data, sql, _ = self.get(client, f'{url}?fields=id,score&cursor=')
+        assert data['results'] == [{'id': review.id, 'score': 8}]
+        assert '"users_user"' not in sql, (
+            'Проверьте, что без поля `author` автор не загружается'
+        )
+        data, _, _ = self.get(
+            client, f'{url}{review.id}/comments/?omit=text,pub_date')
+        assert list(data['results'][0]) == ['id', 'author']
+
+    def test_06_writes_ignore_fields(self, admin_client, title):
+        response = admin_client.patch(
+            f'{self.TITLES_URL}{title.id}/?fields=id',
+            data={'name': 'Новое имя'}, format='json')
+        assert response.status_code == HTTPStatus.OK
+        assert response.json()['name'] == 'Новое имя'
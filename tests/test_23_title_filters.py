@@ -0,0 +1,61 @@
+import pytest
+
+from reviews.models import Category, Genre, Title
+
+
+@pytest.mark.django_db(transaction=True)
+class Test23TitleSlugFilters:
+
+    TITLES_URL = '/api/v1/titles/'
+
+    @pytest.fixture
+    def titles(self):
+        films = Category.objects.create(name='Фильм', slug='films')
+        film_noir = Category.objects.create(name='Нуар', slug='film-noir')
+        books = Category.objects.create(name='Книга', slug='books')
+        drama = Genre.objects.create(name='Драма', slug='drama')
+        comedy = Genre.objects.create(name='Комедия', slug='comedy')
+        data = (
+            ('Фильм', films, (drama, comedy)),
+            ('Нуар', film_noir, (drama,)),
+            ('Книга', books, (comedy,)),
+        )
+        for name, category, genres in data:
+            title = Title.objects.create(
+                name=name, year=2000, category=category)
+            title.genre.set(genres)
+
+    def names(self, client, query):
+        response = client.get(f'{self.TITLES_URL}?{query}')
+        return sorted(title['name'] for title in response.json()['results'])
+
+    @pytest.mark.parametrize('query, expected', (
+        ('category=films', ['Фильм']),
+        ('category=film', []),
+        ('category__in=films,books', ['Книга', 'Фильм']),
+        ('category__startswith=film', ['Нуар', 'Фильм']),
+        ('category__icontains=ILM', ['Нуар', 'Фильм']),
+        ('genre=drama', ['Нуар', 'Фильм']),
+        ('genre__in=drama,comedy', ['Книга', 'Нуар', 'Фильм']),
+        ('genre__in=drama,comedy&category=books', ['Книга']),
+        ('genre=unknown', []),
+    ))
+    def test_01_filters(self, client, titles, query, expected):
+        assert self.names(client, query) == expected, (
+            f'Проверьте фильтрацию произведений по запросу `?{query}`'
+        )
+
+    def test_02_cached_slug_map(self, client, titles,
+                                django_assert_num_queries):
+        self.names(client, 'category=films')
+        # COUNT, страница и жанры: id категории берётся из кеша.
+        with django_assert_num_queries(3):
+            self.names(client, 'category=books')
+        Category.objects.create(name='Музыка', slug='music')
+        title = Title.objects.create(
+            name='Альбом', year=2000, category=Category.objects.get(
+                slug='music'))
+        assert self.names(client, 'category__startswith=mus') == [
+            title.name], (
+            'Проверьте, что карта slug→id обновляется при изменении категорий'
+        )
@@ -0,0 +1,80 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http import HTTPStatus
+
+import pytest
+from django.db import connection
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import AccessToken
+
+from reviews.models import Review, Title
+
+
+@pytest.mark.django_db(transaction=True)
+class Test24ReviewCreate:
+
+    @pytest.fixture
+    def title(self):
+        return Title.objects.create(name='Произведение', year=2000)
+
+    def url(self, title):
+        return f'/api/v1/titles/{title.id}/reviews/'
+
+    def test_01_queries(self, user_client, title,
+                        django_assert_num_queries):
+        # Первый отзыв прогревает кеши состояния и объекта пользователя.
+        other = Title.objects.create(name='Другое', year=2000)
+        user_client.post(self.url(other), data={'text': 'Отзыв', 'score': 1})
+        # SELECT произведения, BEGIN, INSERT и UPDATE рейтинга.
+        with django_assert_num_queries(4):
+            response = user_client.post(
+                self.url(title), data={'text': 'Отзыв', 'score': 7})
+        assert response.status_code == HTTPStatus.CREATED
+        # SELECT произведения, BEGIN, неудачный INSERT и проверка дубля.
+        with django_assert_num_queries(4):
+            response = user_client.post(
+                self.url(title), data={'text': 'Ещё отзыв', 'score': 3})
+        assert response.status_code == HTTPStatus.BAD_REQUEST
+        assert response.json() == {
+            'non_field_errors': ['Ваш отзыв уже есть.']}, (
+            'Проверьте, что повторный отзыв возвращает прежнюю ошибку'
+        )
+        title.refresh_from_db()
+        assert (title.rating_sum, title.rating_count) == (7, 1)
+
+    def test_02_missing_title(self, user_client, title):
+        response = user_client.post(
+            f'/api/v1/titles/{title.id + 1}/reviews/',
+            data={'text': 'Отзыв', 'score': 7})
+        assert response.status_code == HTTPStatus.NOT_FOUND
+
+    def test_03_parallel_reviews(self, user, title):
+        client = APIClient(raise_request_exception=False)
+        client.credentials(
+            HTTP_AUTHORIZATION=f'Bearer {AccessToken.for_user(user)}')
+
+        def post(score):
+            # См. test_18: SQLite в памяти отвечает "table is locked".
+            try:
+                for _ in range(50):
+                    status = client.post(
+                        self.url(title),
+                        data={'text': 'Отзыв', 'score': score},
+                    ).status_code
+                    if status != HTTPStatus.INTERNAL_SERVER_ERROR:
+                        return status
+                    time.sleep(0.01)
+                raise AssertionError('База данных осталась заблокированной')
+            finally:
+                connection.close()
+
+        with ThreadPoolExecutor(8) as executor:
+            statuses = list(executor.map(post, range(1, 9)))
+        assert sorted(statuses) == [HTTPStatus.CREATED] + [
+            HTTPStatus.BAD_REQUEST] * 7, (
+            'Проверьте, что из одновременных отзывов одного автора '
+            'сохраняется ровно один'
+        )
+        review = Review.objects.get()
+        title.refresh_from_db()
+        assert (title.rating_sum, title.rating_count) == (review.score, 1)
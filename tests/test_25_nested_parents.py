@@ -0,0 +1,55 @@
+from http import HTTPStatus
+
+import pytest
+from rest_framework.test import APIRequestFactory
+
+from api.v1.views import CommentViewSet
+from reviews.models import Review, Title
+
+
+@pytest.mark.django_db(transaction=True)
+class Test25NestedParents:
+
+    @pytest.fixture
+    def review(self, admin):
+        title = Title.objects.create(name='Произведение', year=2000)
+        return Review.objects.create(
+            title=title, author=admin, text='Отзыв', score=5)
+
+    def comments_url(self, title_id, review_id):
+        return f'/api/v1/titles/{title_id}/reviews/{review_id}/comments/'
+
+    def test_01_parent_chain_single_query(self, user_client, review,
+                                          django_assert_num_queries):
+        url = self.comments_url(review.title_id, review.id)
+        user_client.post(url, data={'text': 'Прогрев кешей'})
+        # SELECT отзыва вместе с произведением и INSERT комментария.
+        with django_assert_num_queries(2):
+            response = user_client.post(url, data={'text': 'Комментарий'})
+        assert response.status_code == HTTPStatus.CREATED
+        # SELECT отзыва вместе с произведением, COUNT и страница.
+        with django_assert_num_queries(3):
+            response = user_client.get(url)
+        assert response.json()['count'] == 2
+
+    def test_02_mismatched_title(self, client, user_client, review):
+        other = Title.objects.create(name='Другое', year=2000)
+        url = self.comments_url(other.id, review.id)
+        assert client.get(url).status_code == HTTPStatus.NOT_FOUND, (
+            'Проверьте, что отзыв другого произведения не найден'
+        )
+        response = user_client.post(url, data={'text': 'Комментарий'})
+        assert response.status_code == HTTPStatus.NOT_FOUND
+
+    def test_03_serializer_context(self, review):
+        request = APIRequestFactory().get('/')
+        view = CommentViewSet(
+            request=request, format_kwarg=None, action='list',
+            kwargs={'title_id': review.title_id, 'review_id': review.id})
+        context = view.get_serializer_context()
+        assert context['review'] == review
+        assert context['title'] == review.title
+        assert view.get_parent('title') is context['title'], (
+            'Проверьте, что родительские объекты загружаются один раз '
+            'за запрос'
+        )
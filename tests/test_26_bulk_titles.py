@@ -0,0 +1,95 @@
+from http import HTTPStatus
+
+import pytest
+
+from reviews.models import Category, Genre, GenreTitle, Title
+
+
+@pytest.mark.django_db(transaction=True)
+class Test26BulkTitles:
+
+    URL = '/api/v1/titles/bulk/'
+
+    @pytest.fixture(autouse=True)
+    def slugs(self):
+        Category.objects.create(name='Фильм', slug='films')
+        Genre.objects.create(name='Драма', slug='drama')
+        Genre.objects.create(name='Комедия', slug='comedy')
+
+    def items(self, count):
+        return [
+            {'name': f'Произведение {idx}', 'year': 2000,
+             'category': 'films', 'genre': ['drama', 'comedy', 'drama']}
+            for idx in range(count)
+        ]
+
+    def test_01_permissions(self, client, user_client, moderator_client):
+        assert client.post(
+            self.URL, data='[]', content_type='application/json'
+        ).status_code == HTTPStatus.UNAUTHORIZED
+        for api_client in (user_client, moderator_client):
+            response = api_client.post(self.URL, data=[], format='json')
+            assert response.status_code == HTTPStatus.FORBIDDEN, (
+                'Проверьте, что массовое создание доступно только админу'
+            )
+
+    def test_02_bulk_create(self, admin_client, django_assert_max_num_queries):
+        items = self.items(20)
+        items[3] = {'name': 'Ошибка', 'year': 2000, 'category': 'unknown'}
+        items[5] = {'year': 2000}
+        # Запросы за категориями и жанрами выполняются один раз на пакет.
+        with django_assert_max_num_queries(len(items) + 10):
+            response = admin_client.post(self.URL, data=items, format='json')
+        assert response.status_code == HTTPStatus.MULTI_STATUS
+        results = response.json()['results']
+        assert [result['status'] for result in results] == [
+            HTTPStatus.BAD_REQUEST if idx in (3, 5) else HTTPStatus.CREATED
+            for idx in range(20)
+        ], 'Проверьте, что ошибки отдельных произведений не прерывают пакет'
+        assert 'category' in results[3]['errors']
+        assert 'name' in results[5]['errors']
+        assert Title.objects.count() == 18
+        assert GenreTitle.objects.count() == 36
+        created = results[0]['data']
+        assert created['category'] == {'name': 'Фильм', 'slug': 'films'}
+        assert {genre['slug'] for genre in created['genre']} == {
+            'drama', 'comedy'}
+        assert Title.objects.get(id=created['id']).name == 'Произведение 0'
+
+    def test_03_bulk_update(self, admin_client, client):
+        response = admin_client.post(
+            self.URL, data=self.items(2), format='json')
+        first, second = (
+            result['data']['id'] for result in response.json()['results'])
+        etag = client.get(f'/api/v1/titles/{first}/')['ETag']
+        response = admin_client.patch(self.URL, data=[
+            {'id': first, 'name': 'Новое имя', 'genre': ['comedy']},
+            {'id': second, 'year': 1999},
+            {'id': 0, 'name': 'Нет такого'},
+        ], format='json')
+        assert response.status_code == HTTPStatus.MULTI_STATUS
+        results = response.json()['results']
+        assert [result['status'] for result in results] == [
+            HTTPStatus.OK, HTTPStatus.OK, HTTPStatus.NOT_FOUND]
+        assert results[0]['data']['genre'] == [
+            {'name': 'Комедия', 'slug': 'comedy'}]
+        title = Title.objects.get(id=first)
+        assert title.name == 'Новое имя'
+        assert list(title.genre.values_list('slug', flat=True)) == [
+            'comedy']
+        assert Title.objects.get(id=second).year == 1999
+        assert client.get(f'/api/v1/titles/{first}/')['ETag'] != etag, (
+            'Проверьте, что массовое обновление сбрасывает ETag произведения'
+        )
+
+    def test_04_invalid_body(self, admin_client, settings):
+        response = admin_client.post(
+            self.URL, data={'name': 'Одно'}, format='json')
+        assert response.status_code == HTTPStatus.BAD_REQUEST
+        settings.TITLES_BULK_LIMIT = 2
+        response = admin_client.post(
+            self.URL, data=self.items(3), format='json')
+        assert response.status_code == HTTPStatus.BAD_REQUEST, (
+            'Проверьте, что размер пакета ограничен TITLES_BULK_LIMIT'
+        )
+        assert not Title.objects.exists()
@@ -0,0 +1,174 @@
+from datetime import timedelta
+from http import HTTPStatus
+
+import pytest
+from django.utils import timezone
+
+from reviews.models import Comment, Review, Title
+from reviews.ratings import inconsistent_ratings
+
+
+@pytest.mark.django_db(transaction=True)
+class Test27Moderation:
+
+    REVIEWS_URL = '/api/v1/moderation/reviews/'
+    COMMENTS_URL = '/api/v1/moderation/comments/'
+
+    @pytest.fixture
+    def spam(self, admin, user, moderator):
+        titles = [
+            Title.objects.create(name=f'Произведение {idx}', year=2000)
+            for idx in range(3)
+        ]
+        reviews = []
+        for title in titles:
+            reviews.append(Review.objects.create(
+                title=title, author=user, text='Спам', score=1))
+            reviews.append(Review.objects.create(
+                title=title, author=admin, text='Отзыв', score=9))
+        for review in reviews:
+            for author in (user, moderator):
+                Comment.objects.create(
+                    review=review, author=author, text='Комментарий')
+        return titles, reviews
+
+    def test_01_permissions(self, client, user_client, moderator_client,
+                            admin_client, spam):
+        body = '{"action": "delete", "ids": [1]}'
+        for url in (self.REVIEWS_URL, self.COMMENTS_URL):
+            assert client.post(
+                url, data=body, content_type='application/json'
+            ).status_code == HTTPStatus.UNAUTHORIZED
+            response = user_client.post(
+                url, data={'action': 'delete', 'ids': [1]}, format='json')
+            assert response.status_code == HTTPStatus.FORBIDDEN, (
+                'Проверьте, что массовая модерация недоступна пользователю'
+            )
+        for api_client in (moderator_client, admin_client):
+            response = api_client.post(
+                self.COMMENTS_URL, data={'action': 'hide', 'ids': [1]},
+                format='json')
+            assert response.status_code == HTTPStatus.OK
+
+    def test_02_delete_reviews_by_author(self, moderator_client, user, spam,
+                                         django_assert_max_num_queries):
+        titles, _ = spam
+        # Число запросов не зависит от количества отзывов и произведений.
+        with django_assert_max_num_queries(8):
+            response = moderator_client.post(
+                self.REVIEWS_URL,
+                data={'action': 'delete', 'author': user.username},
+                format='json')
+        assert response.status_code == HTTPStatus.OK
+        assert response.json() == {'reviews': 3, 'comments': 6, 'titles': 3}
+        assert not Review.objects.filter(author=user).exists()
+        assert Comment.objects.count() == 6
+        assert not inconsistent_ratings().exists(), (
+            'Проверьте, что рейтинги пересчитаны после массового удаления'
+        )
+        assert Title.objects.get(pk=titles[0].pk).rating == 9
+
+    def test_03_hide_and_restore_reviews(self, client, moderator_client,
+                                         spam):
+        titles, reviews = spam
+        url = f'/api/v1/titles/{titles[0].id}/reviews/'
+        etag = client.get(url)['ETag']
+        response = moderator_client.post(
+            self.REVIEWS_URL,
+            data={'action': 'hide', 'ids': [reviews[0].id, reviews[1].id]},
+            format='json')
+        assert response.json() == {'reviews': 2, 'comments': 0, 'titles': 1}
+        response = client.get(url)
+        assert response['ETag'] != etag, (
+            'Проверьте, что модерация сбрасывает ETag списка отзывов'
+        )
+        assert response.json()['count'] == 0, (
+            'Проверьте, что скрытые отзывы не попадают в список'
+        )
+        assert client.get(
+            f'{url}{reviews[0].id}/').status_code == HTTPStatus.NOT_FOUND
+        title = client.get(f'/api/v1/titles/{titles[0].id}/').json()
+        assert title['rating'] is None, (
+            'Проверьте, что скрытые отзывы не учитываются в рейтинге'
+        )
+        review = Review.objects.get(pk=reviews[1].pk)
+        review.score = 3
+        review.save()
+        assert not inconsistent_ratings().exists()
+        response = moderator_client.post(
+            self.REVIEWS_URL,
+            data={'action': 'restore', 'ids': [reviews[0].id]},
+            format='json')
+        assert response.json()['reviews'] == 1
+        assert client.get(url).json()['count'] == 1
+        assert not inconsistent_ratings().exists()
+
+    def test_04_comments_by_time_range(self, client, moderator_client,
+                                       moderator, spam):
+        _, reviews = spam
+        old = timezone.now() - timedelta(days=1)
+        Comment.objects.filter(author=moderator).update(pub_date=old)
+        response = moderator_client.post(
+            self.COMMENTS_URL,
+            data={'action': 'hide', 'until': timezone.now().isoformat()},
+            format='json')
+        assert response.json() == {'comments': 12, 'reviews': 6}
+        response = moderator_client.post(
+            self.COMMENTS_URL,
+            data={'action': 'delete',
+                  'since': (old - timedelta(hours=1)).isoformat(),
+                  'until': (old + timedelta(hours=1)).isoformat()},
+            format='json')
+        assert response.json() == {'comments': 6, 'reviews': 6}
+        assert not Comment.objects.filter(author=moderator).exists()
+        review = reviews[0]
+        response = client.get(
+            f'/api/v1/titles/{review.title_id}/reviews/{review.id}/'
+            'comments/')
+        assert response.json()['count'] == 0, (
+            'Проверьте, что скрытые комментарии не попадают в список'
+        )
+
+    def test_05_invalid_body(self, moderator_client, settings, spam):
+        for data in (
+            {'action': 'delete'},
+            {'action': 'purge', 'ids': [1]},
+            {'action': 'delete', 'author': 'nobody'},
+            {'action': 'delete', 'since': '2020-01-02T00:00:00Z',
+             'until': '2020-01-01T00:00:00Z'},
+        ):
+            response = moderator_client.post(
+                self.REVIEWS_URL, data=data, format='json')
+            assert response.status_code == HTTPStatus.BAD_REQUEST, (
+                f'Проверьте, что запрос {data} отклоняется'
+            )
+        settings.MODERATION_IDS_LIMIT = 2
+        response = moderator_client.post(
+            self.COMMENTS_URL, data={'action': 'delete', 'ids': [1, 2, 3]},
+            format='json')
+        assert response.status_code == HTTPStatus.BAD_REQUEST
+        assert Review.objects.count() == 6
+        assert Comment.objects.count() == 12
+
+    def test_06_comments_of_hidden_review(self, client, user_client,
+                                          moderator_client, spam):
+        _, reviews = spam
+        review = reviews[0]
+        url = (f'/api/v1/titles/{review.title_id}/reviews/{review.id}/'
+               'comments/')
+        etag = client.get(url)['ETag']
+        moderator_client.post(
+            self.REVIEWS_URL, data={'action': 'hide', 'ids': [review.id]},
+            format='json')
+        response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == HTTPStatus.NOT_FOUND, (
+            'Проверьте, что комментарии скрытого отзыва не публикуются'
+        )
+        response = user_client.post(url, data={'text': 'Ещё спам'})
+        assert response.status_code == HTTPStatus.NOT_FOUND, (
+            'Проверьте, что к скрытому отзыву нельзя добавить комментарий'
+        )
+        moderator_client.post(
+            self.REVIEWS_URL, data={'action': 'restore', 'ids': [review.id]},
+            format='json')
+        assert client.get(url).json()['count'] == 2
@@ -0,0 +1,110 @@
+from http import HTTPStatus
+
+import pytest
+from django.core.management import call_command
+
+from reviews.models import Comment, Review, Title
+from reviews.ratings import inconsistent_ratings
+from users.models import User, UserRemoval
+from users.removal import remove_batch
+
+
+@pytest.mark.django_db(transaction=True)
+class Test28UserRemoval:
+
+    USERS_URL = '/api/v1/users/'
+
+    @pytest.fixture
+    def content(self, admin, user, moderator):
+        titles = [
+            Title.objects.create(name=f'Произведение {idx}', year=2000)
+            for idx in range(3)
+        ]
+        for title in titles:
+            review = Review.objects.create(
+                title=title, author=user, text='Отзыв', score=2)
+            Review.objects.create(
+                title=title, author=admin, text='Отзыв', score=8)
+            for author in (user, moderator, moderator):
+                Comment.objects.create(
+                    review=review, author=author, text='Комментарий')
+        other = Review.objects.get(title=titles[0], author=admin)
+        Comment.objects.create(review=other, author=user, text='Ответ')
+        return titles
+
+    def test_01_user_without_content(self, admin_client, user):
+        response = admin_client.delete(f'{self.USERS_URL}{user.username}/')
+        assert response.status_code == HTTPStatus.NO_CONTENT
+        assert not User.objects.filter(pk=user.pk).exists(), (
+            'Проверьте, что пользователь без отзывов и комментариев '
+            'удаляется сразу'
+        )
+        assert not UserRemoval.objects.exists()
+
+    def test_02_deactivated_immediately(self, admin_client, user_client,
+                                        user, content,
+                                        django_assert_max_num_queries):
+        # Число запросов не зависит от количества отзывов и комментариев.
+        with django_assert_max_num_queries(10):
+            response = admin_client.delete(
+                f'{self.USERS_URL}{user.username}/')
+        assert response.status_code == HTTPStatus.ACCEPTED
+        assert response.json()['username'] == user.username
+        assert response.json()['finished'] is None
+        assert not User.objects.get(pk=user.pk).is_active, (
+            'Проверьте, что DELETE-запрос сразу деактивирует пользователя'
+        )
+        assert Review.objects.filter(author=user).count() == 3, (
+            'Проверьте, что каскадное удаление выполняется в фоне'
+        )
+        assert user_client.get(
+            f'{self.USERS_URL}me/').status_code == HTTPStatus.UNAUTHORIZED
+        assert admin_client.get(
+            f'{self.USERS_URL}{user.username}/'
+        ).status_code == HTTPStatus.NOT_FOUND
+        usernames = [
+            item['username']
+            for item in admin_client.get(self.USERS_URL).json()['results']
+        ]
+        assert user.username not in usernames
+
+    def test_03_background_removal(self, admin_client, client, user,
+                                   content):
+        url = f'/api/v1/titles/{content[0].id}/reviews/'
+        etag = client.get(url)['ETag']
+        admin_client.delete(f'{self.USERS_URL}{user.username}/')
+        call_command('remove_users', batch_size=2)
+        removal = UserRemoval.objects.get()
+        assert removal.finished is not None
+        assert removal.user is None
+        assert (removal.deleted_reviews, removal.deleted_comments) == (3, 10)
+        assert not User.objects.filter(pk=user.pk).exists()
+        assert Review.objects.count() == 3
+        assert Comment.objects.count() == 0
+        assert not inconsistent_ratings().exists(), (
+            'Проверьте, что рейтинги пересчитаны после удаления отзывов'
+        )
+        assert Title.objects.get(pk=content[0].pk).rating == 8
+        assert client.get(url)['ETag'] != etag
+        assert remove_batch(2) is None
+
+    def test_04_bounded_batches(self, admin_client, user, content):
+        admin_client.delete(f'{self.USERS_URL}{user.username}/')
+        total = Review.objects.count() + Comment.objects.count()
+        progress = []
+        while True:
+            removal = remove_batch(2)
+            if removal is None:
+                break
+            progress.append(
+                removal.deleted_reviews + removal.deleted_comments)
+        steps = [
+            current - previous
+            for previous, current in zip([0] + progress, progress)
+        ]
+        assert max(steps) <= 2, (
+            'Проверьте, что за одну транзакцию удаляется не больше '
+            'batch_size строк'
+        )
+        assert progress[-1] == total - Review.objects.count()
+        assert not User.objects.filter(pk=user.pk).exists()